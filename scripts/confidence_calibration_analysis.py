@@ -13,7 +13,11 @@ Key Features:
 - Provides detailed confidence difference reporting
 
 Usage:
-    python scripts/confidence_calibration_analysis.py
+    python scripts/confidence_calibration_analysis.py [--no-cache]
+
+Results are cached in .calibration_cache.json, keyed by the library version and
+a digest of its source files, so re-runs only analyze cases whose results could
+have changed. Pass --no-cache to force a fresh analysis of every case.
 
 This tool was essential for identifying and fixing the parent key parsing bug
 where "C major" was incorrectly parsed as "C minor", leading to a major improvement
@@ -25,22 +29,85 @@ Purpose: Production confidence calibration and debugging
 """
 
 import asyncio
+import hashlib
 import json
 import os
 import sys
+from pathlib import Path
+
+import fast_json
 
+import harmonic_analysis
 from harmonic_analysis.multiple_interpretation_service import \
     analyze_progression_multiple
 from harmonic_analysis.types import AnalysisOptions
 
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
+CACHE_PATH = Path(".calibration_cache.json")
+
+
+def library_fingerprint():
+    """Identify the analyzed library: its version plus a digest of its sources,
+    so both releases and local edits invalidate cached results"""
+    digest = hashlib.sha256()
+    package_dir = Path(harmonic_analysis.__file__).parent
+    for source in sorted(package_dir.glob("*.py")):
+        digest.update(source.read_bytes())
+    return f"{harmonic_analysis.__version__}-{digest.hexdigest()[:16]}"
+
+
+def load_cache(fingerprint):
+    """Load cached case summaries, discarding them if the library changed"""
+    try:
+        with open(CACHE_PATH, "rb") as f:
+            cache = fast_json.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    if cache.get("fingerprint") != fingerprint:
+        return {}
+    return cache["results"]
+
+
+def save_cache(fingerprint, results):
+    with open(CACHE_PATH, "w") as f:
+        json.dump({"fingerprint": fingerprint, "results": results}, f)
+
+
+def cache_key(case):
+    return json.dumps([case["chords"], case.get("parent_key")])
+
 
-async def analyze_test_cases():
-    with open("tests/generated/comprehensive-multi-layer-tests.json", "r") as f:
-        data = json.load(f)
+def build_options(case):
+    """Use the test case's parent_key context if available"""
+    parent_key = case.get("parent_key")
+    return AnalysisOptions(parent_key=parent_key) if parent_key else None
+
+
+async def summarize_case(case):
+    """Analyze a test case, keeping only what the report needs"""
+    result = await analyze_progression_multiple(case["chords"], build_options(case))
+    primary = result.primary_analysis
+    return [primary.confidence, str(primary.type), len(primary.evidence)]
+
+
+def print_case_result(case, expected_conf, summary):
+    actual_conf, interpretation_type, evidence_count = summary
+
+    print(f"Chords: {case['chords']}")
+    print(f"Parent Key: {case.get('parent_key')}")
+    print(f"Expected: {expected_conf:.3f}")
+    print(f"Actual:   {actual_conf:.3f}")
+    print(f"Diff:     {abs(expected_conf - actual_conf):.3f}")
+    print(f"Type:     {interpretation_type}")
+    print(f"Evidence: {evidence_count} pieces")
+    print("-" * 15)
+
+
+async def analyze_test_cases(use_cache=True):
+    with open("tests/generated/comprehensive-multi-layer-tests.json", "rb") as f:
+        test_cases = fast_json.loads(f.read())["test_cases"]
 
-    test_cases = data["test_cases"]
     functional_cases = [
         tc for tc in test_cases if tc["category"] == "functional_clear"
     ][:10]
@@ -48,52 +115,38 @@ async def analyze_test_cases():
         :5
     ]
 
+    fingerprint = library_fingerprint()
+    summaries = load_cache(fingerprint) if use_cache else {}
+
+    # The analyses are independent, so run the uncached ones concurrently
+    pending = {
+        cache_key(case): case
+        for case in functional_cases + modal_cases
+        if cache_key(case) not in summaries
+    }
+    if pending:
+        results = await asyncio.gather(*map(summarize_case, pending.values()))
+        summaries.update(zip(pending, results))
+        save_cache(fingerprint, summaries)
+
     print("CONFIDENCE ANALYSIS:")
     print("=" * 50)
     print("\nFUNCTIONAL HARMONY CASES:")
     print("-" * 30)
 
     for case in functional_cases:
-        chords = case["chords"]
-        expected_conf = case["expected_functional"]["confidence"]
-        parent_key = case.get("parent_key")
-
-        # Use parent_key context if available
-        options = AnalysisOptions(parent_key=parent_key) if parent_key else None
-        result = await analyze_progression_multiple(chords, options)
-        actual_conf = result.primary_analysis.confidence
-
-        print(f"Chords: {chords}")
-        print(f"Parent Key: {parent_key}")
-        print(f"Expected: {expected_conf:.3f}")
-        print(f"Actual:   {actual_conf:.3f}")
-        print(f"Diff:     {abs(expected_conf - actual_conf):.3f}")
-        print(f"Type:     {result.primary_analysis.type}")
-        print(f"Evidence: {len(result.primary_analysis.evidence)} pieces")
-        print("-" * 15)
+        print_case_result(
+            case, case["expected_functional"]["confidence"], summaries[cache_key(case)]
+        )
 
     print("\nMODAL CHARACTERISTIC CASES:")
     print("-" * 30)
 
     for case in modal_cases:
-        chords = case["chords"]
-        expected_conf = case["expected_modal"]["confidence"]
-        parent_key = case.get("parent_key")
-
-        # Use parent_key context if available
-        options = AnalysisOptions(parent_key=parent_key) if parent_key else None
-        result = await analyze_progression_multiple(chords, options)
-        actual_conf = result.primary_analysis.confidence
-
-        print(f"Chords: {chords}")
-        print(f"Parent Key: {parent_key}")
-        print(f"Expected: {expected_conf:.3f}")
-        print(f"Actual:   {actual_conf:.3f}")
-        print(f"Diff:     {abs(expected_conf - actual_conf):.3f}")
-        print(f"Type:     {result.primary_analysis.type}")
-        print(f"Evidence: {len(result.primary_analysis.evidence)} pieces")
-        print("-" * 15)
+        print_case_result(
+            case, case["expected_modal"]["confidence"], summaries[cache_key(case)]
+        )
 
 
 if __name__ == "__main__":
-    asyncio.run(analyze_test_cases())
+    asyncio.run(analyze_test_cases(use_cache="--no-cache" not in sys.argv[1:]))
@@ -2,27 +2,139 @@
 """
 Export comprehensive test failures with detailed expected vs actual results.
 Creates both human-readable and machine-readable output for analysis.
+
+Detailed failures are written as NDJSON (one failure per line) with a
+metadata sidecar; pass --pretty to get a single indented JSON document instead.
 """
 
 import asyncio
 import csv
 import json
 import sys
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Dict, List, Optional
 
 # Add src to path for imports
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
+import fast_json
+
 from harmonic_analysis import analyze_progression_multiple
 from harmonic_analysis.multiple_interpretation_service import \
     InterpretationType
 from harmonic_analysis.types import AnalysisOptions
 
+# Serialized interpretation types, as stored in analysis results
+_TYPE_NAMES = {kind: str(kind) for kind in InterpretationType}
+_FUNCTIONAL = _TYPE_NAMES[InterpretationType.FUNCTIONAL]
+_MODAL = _TYPE_NAMES[InterpretationType.MODAL]
+_CHROMATIC = _TYPE_NAMES[InterpretationType.CHROMATIC]
+
+# Maximum number of test cases analyzed concurrently
+MAX_CONCURRENT_ANALYSES = 50
+
+# Column order of the summary CSV
+CSV_FIELDNAMES = (
+    "test_id",
+    "category",
+    "chords",
+    "failure_type",
+    "specific_failures",
+    "description",
+)
+
+
+def write_ndjson_report(path: Path, failures: List[Dict]) -> None:
+    """Write the detailed failure dump as one JSON record per line"""
+    with open(path, "wb") as f:
+        for failure in failures:
+            f.write(fast_json.dumps(failure))
+            f.write(b"\n")
+
+
+def write_metadata(path: Path, metadata: Dict) -> None:
+    """Write the run metadata sidecar for the NDJSON dump"""
+    with open(path, "w") as f:
+        json.dump(metadata, f, indent=2)
+
+
+def write_pretty_json_report(path: Path, metadata: Dict, failures: List[Dict]) -> None:
+    """Write metadata and failures as a single indented JSON document"""
+    with open(path, "wb") as f:
+        payload = {"metadata": metadata, "failures": failures}
+        f.write(fast_json.dumps(payload, pretty=True))
+
+
+def write_csv_report(path: Path, failures: List[Dict]) -> None:
+    """Write one summary row per failed test case"""
+    with open(path, "w", newline="") as f:
+        if failures:
+            writer = csv.writer(f)
+            writer.writerow(CSV_FIELDNAMES)
+            writer.writerows(
+                (
+                    failure["test_id"],
+                    failure["category"],
+                    " -> ".join(failure["chords"]),
+                    failure["failure_type"],
+                    "; ".join(
+                        [
+                            f"{f['type']}: expected={f.get('expected', 'N/A')} actual={f.get('actual', 'N/A')}"
+                            for f in failure.get("failures", [])
+                        ]
+                    ),
+                    failure.get("description", ""),
+                )
+                for failure in failures
+            )
+
+
+def write_text_report(path: Path, metadata: Dict, failures: List[Dict]) -> None:
+    """Write the human-readable summary grouped by category"""
+    lines = [
+        "COMPREHENSIVE TEST FAILURE ANALYSIS\n",
+        "=" * 50 + "\n\n",
+        f"Generated: {metadata['timestamp']}\n",
+        f"Total Tests: {metadata['total_tests']}\n",
+        f"Failed Tests: {metadata['failed_tests']}\n",
+        f"Success Rate: {metadata['success_rate']:.1f}%\n\n",
+    ]
+
+    # Group failures by category
+    by_category = defaultdict(list)
+    for failure in failures:
+        by_category[failure["category"]].append(failure)
+
+    for category, category_failures in by_category.items():
+        lines.append(
+            f"\n{category.upper()} FAILURES ({len(category_failures)} cases)\n"
+        )
+        lines.append("-" * 40 + "\n")
+
+        for failure in category_failures[:10]:  # Show first 10 of each category
+            lines.append(f"\nTest ID: {failure['test_id']}\n")
+            lines.append(f"Chords: {' -> '.join(failure['chords'])}\n")
+            lines.append(f"Description: {failure.get('description', 'N/A')}\n")
+            lines.extend(
+                f"  - {specific['type']}: Expected={specific.get('expected', 'N/A')}, Actual={specific.get('actual', 'N/A')}\n"
+                for specific in failure.get("failures", [])
+            )
+            lines.append("\n")
+
+        if len(category_failures) > 10:
+            lines.append(
+                f"... and {len(category_failures) - 10} more {category} failures\n"
+            )
+
+    with open(path, "w") as f:
+        f.write("".join(lines))
+
 
 class TestFailureExporter:
-    def __init__(self):
+    def __init__(self, pretty: bool = False):
+        self.pretty = pretty
         self.failures = []
         self.test_data = None
 
@@ -49,8 +161,8 @@ class TestFailureExporter:
                 ]
             )
 
-        with open(test_file, "r") as f:
-            data = json.load(f)
+        with open(test_file, "rb") as f:
+            data = fast_json.loads(f.read())
             return data["test_cases"]
 
     async def analyze_test_case(self, test_case: Dict) -> Dict:
@@ -73,14 +185,14 @@ class TestFailureExporter:
                 "description": test_case.get("description", ""),
                 "parent_key": test_case.get("parent_key"),
                 "result": {
-                    "primary_type": str(result.primary_analysis.type),
+                    "primary_type": _TYPE_NAMES[result.primary_analysis.type],
                     "primary_confidence": result.primary_analysis.confidence,
                     "primary_analysis": result.primary_analysis.analysis,
                     "primary_key": result.primary_analysis.key_signature,
                     "primary_roman": result.primary_analysis.roman_numerals,
                     "alternatives": [
                         {
-                            "type": str(alt.type),
+                            "type": _TYPE_NAMES[alt.type],
                             "confidence": alt.confidence,
                             "analysis": alt.analysis,
                             "key": alt.key_signature,
@@ -123,34 +235,45 @@ class TestFailureExporter:
                 "category": analysis_result["category"],
             }
 
+        func_expected = expected.get("functional") or {}
+        modal_expected = expected.get("modal") or {}
+        chromatic_expected = expected.get("chromatic") or {}
+        func_detected = func_expected.get("detected", False)
+        modal_detected = modal_expected.get("detected", False)
+        chromatic_detected = chromatic_expected.get("detected", False)
+
+        # Nothing to validate when no interpretation is expected
+        if not (func_detected or modal_detected or chromatic_detected):
+            return None
+
         failures = []
+        primary_type = actual["primary_type"]
+        primary_confidence = actual["primary_confidence"]
+        primary_key = actual["primary_key"]
+        primary_analysis = actual["primary_analysis"]
+        primary_roman = actual["primary_roman"]
+        # Reversed so the first alternative of each type wins, as in a linear scan
+        alts_by_type = {alt["type"]: alt for alt in reversed(actual["alternatives"])}
 
         # Check functional expectations
-        if expected.get("functional", {}).get("detected", False):
-            func_expected = expected["functional"]
-
+        if func_detected:
             # Check if functional analysis is primary or alternative
-            is_functional_primary = actual["primary_type"] == str(
-                InterpretationType.FUNCTIONAL
-            )
+            is_functional_primary = primary_type == _FUNCTIONAL
             functional_result = None
 
             if is_functional_primary:
                 functional_result = {
-                    "confidence": actual["primary_confidence"],
-                    "key_center": actual["primary_key"],
-                    "roman_numerals": actual["primary_roman"],
+                    "confidence": primary_confidence,
+                    "key_center": primary_key,
+                    "roman_numerals": primary_roman,
+                }
+            elif _FUNCTIONAL in alts_by_type:
+                alt = alts_by_type[_FUNCTIONAL]
+                functional_result = {
+                    "confidence": alt["confidence"],
+                    "key_center": alt["key"],
+                    "roman_numerals": alt["roman"],
                 }
-            else:
-                # Look for functional in alternatives
-                for alt in actual["alternatives"]:
-                    if alt["type"] == str(InterpretationType.FUNCTIONAL):
-                        functional_result = {
-                            "confidence": alt["confidence"],
-                            "key_center": alt["key"],
-                            "roman_numerals": alt["roman"],
-                        }
-                        break
 
             if functional_result:
                 # Check confidence
@@ -191,29 +314,24 @@ class TestFailureExporter:
                     )
 
         # Check modal expectations
-        if expected.get("modal", {}).get("detected", False):
-            modal_expected = expected["modal"]
-
+        if modal_detected:
             # Check if modal analysis is primary or alternative
-            is_modal_primary = actual["primary_type"] == str(InterpretationType.MODAL)
+            is_modal_primary = primary_type == _MODAL
             modal_result = None
 
             if is_modal_primary:
                 modal_result = {
-                    "confidence": actual["primary_confidence"],
-                    "mode": actual["primary_analysis"],  # Mode info is in analysis text
-                    "key": actual["primary_key"],
+                    "confidence": primary_confidence,
+                    "mode": primary_analysis,  # Mode info is in analysis text
+                    "key": primary_key,
+                }
+            elif _MODAL in alts_by_type:
+                alt = alts_by_type[_MODAL]
+                modal_result = {
+                    "confidence": alt["confidence"],
+                    "mode": alt["analysis"],
+                    "key": alt["key"],
                 }
-            else:
-                # Look for modal in alternatives
-                for alt in actual["alternatives"]:
-                    if alt["type"] == str(InterpretationType.MODAL):
-                        modal_result = {
-                            "confidence": alt["confidence"],
-                            "mode": alt["analysis"],
-                            "key": alt["key"],
-                        }
-                        break
 
             if modal_result:
                 # Check confidence
@@ -241,22 +359,17 @@ class TestFailureExporter:
                     )
 
         # Check chromatic expectations
-        if expected.get("chromatic", {}).get("detected", False):
-            chromatic_expected = expected["chromatic"]
-
+        if chromatic_detected:
             # Look for chromatic analysis (usually alternative)
-            is_chromatic_primary = actual["primary_type"] == str(
-                InterpretationType.CHROMATIC
-            )
+            is_chromatic_primary = primary_type == _CHROMATIC
             chromatic_result = None
 
             if is_chromatic_primary:
-                chromatic_result = {"confidence": actual["primary_confidence"]}
-            else:
-                for alt in actual["alternatives"]:
-                    if alt["type"] == str(InterpretationType.CHROMATIC):
-                        chromatic_result = {"confidence": alt["confidence"]}
-                        break
+                chromatic_result = {"confidence": primary_confidence}
+            elif _CHROMATIC in alts_by_type:
+                chromatic_result = {
+                    "confidence": alts_by_type[_CHROMATIC]["confidence"]
+                }
 
             if chromatic_result:
                 expected_conf = chromatic_expected.get("confidence", 0.5)
@@ -279,8 +392,6 @@ class TestFailureExporter:
                 "category": analysis_result["category"],
                 "description": analysis_result["description"],
                 "failures": failures,
-                "full_expected": expected,
-                "full_actual": actual,
             }
 
         return None
@@ -292,154 +403,79 @@ class TestFailureExporter:
 
         print(f"📊 Analyzing {len(test_cases)} test cases...")
 
-        all_results = []
-        failed_results = []
+        # Cap in-flight analyses without stalling on the slowest case of a batch
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_ANALYSES)
 
-        # Process in batches to avoid overwhelming the system
-        batch_size = 50
-        for i in range(0, len(test_cases), batch_size):
-            batch = test_cases[i : i + batch_size]
-            print(
-                f"  Processing batch {i//batch_size + 1}/{(len(test_cases) + batch_size - 1)//batch_size}"
-            )
-
-            # Analyze batch
-            batch_results = await asyncio.gather(
-                *[self.analyze_test_case(test_case) for test_case in batch]
-            )
+        # Validate each case as soon as it finishes so only failures are retained
+        async def validate_bounded(test_case: Dict) -> Optional[Dict]:
+            async with semaphore:
+                result = await self.analyze_test_case(test_case)
+            return self.validate_test_case(result)
 
-            # Validate results
-            for result in batch_results:
-                all_results.append(result)
-                failure = self.validate_test_case(result)
-                if failure:
-                    failed_results.append(failure)
+        outcomes = await asyncio.gather(*map(validate_bounded, test_cases))
+        total_tests = len(outcomes)
+        failed_results = [failure for failure in outcomes if failure]
 
         print(f"\n📊 ANALYSIS COMPLETE:")
-        print(f"  Total tests: {len(all_results)}")
+        print(f"  Total tests: {total_tests}")
         print(f"  Failed tests: {len(failed_results)}")
         print(
-            f"  Success rate: {(len(all_results) - len(failed_results)) / len(all_results) * 100:.1f}%"
+            f"  Success rate: {(total_tests - len(failed_results)) / total_tests * 100:.1f}%"
         )
 
         # Export results
-        await self.export_results(all_results, failed_results)
+        await self.export_results(total_tests, failed_results)
 
     async def export_results(
-        self, all_results: List[Dict], failed_results: List[Dict]
+        self, total_tests: int, failed_results: List[Dict]
     ) -> None:
         """Export results in multiple formats"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-        # Export detailed failures as JSON
-        failures_json = (
-            Path(__file__).parent.parent / f"test_failures_detailed_{timestamp}.json"
-        )
-        with open(failures_json, "w") as f:
-            json.dump(
-                {
-                    "metadata": {
-                        "timestamp": datetime.now().isoformat(),
-                        "total_tests": len(all_results),
-                        "failed_tests": len(failed_results),
-                        "success_rate": (len(all_results) - len(failed_results))
-                        / len(all_results)
-                        * 100,
-                    },
-                    "failures": failed_results,
-                },
-                f,
-                indent=2,
-                default=str,
-            )
-
-        # Export summary as CSV
-        failures_csv = (
-            Path(__file__).parent.parent / f"test_failures_summary_{timestamp}.csv"
-        )
-        with open(failures_csv, "w", newline="") as f:
-            if failed_results:
-                writer = csv.DictWriter(
-                    f,
-                    fieldnames=[
-                        "test_id",
-                        "category",
-                        "chords",
-                        "failure_type",
-                        "specific_failures",
-                        "description",
-                    ],
+        output_dir = Path(__file__).parent.parent
+        failures_csv = output_dir / f"test_failures_summary_{timestamp}.csv"
+        summary_txt = output_dir / f"test_failures_readable_{timestamp}.txt"
+
+        metadata = {
+            "timestamp": datetime.now().isoformat(),
+            "total_tests": total_tests,
+            "failed_tests": len(failed_results),
+            "success_rate": (total_tests - len(failed_results)) / total_tests * 100,
+        }
+
+        if self.pretty:
+            failures_json = output_dir / f"test_failures_detailed_{timestamp}.json"
+            json_writes = [
+                asyncio.to_thread(
+                    write_pretty_json_report, failures_json, metadata, failed_results
                 )
-                writer.writeheader()
-
-                for failure in failed_results:
-                    writer.writerow(
-                        {
-                            "test_id": failure["test_id"],
-                            "category": failure["category"],
-                            "chords": " -> ".join(failure["chords"]),
-                            "failure_type": failure["failure_type"],
-                            "specific_failures": "; ".join(
-                                [
-                                    f"{f['type']}: expected={f.get('expected', 'N/A')} actual={f.get('actual', 'N/A')}"
-                                    for f in failure.get("failures", [])
-                                ]
-                            ),
-                            "description": failure.get("description", ""),
-                        }
-                    )
-
-        # Export human-readable summary
-        summary_txt = (
-            Path(__file__).parent.parent / f"test_failures_readable_{timestamp}.txt"
+            ]
+        else:
+            failures_json = output_dir / f"test_failures_detailed_{timestamp}.ndjson"
+            metadata_json = output_dir / f"test_failures_metadata_{timestamp}.json"
+            json_writes = [
+                asyncio.to_thread(write_ndjson_report, failures_json, failed_results),
+                asyncio.to_thread(write_metadata, metadata_json, metadata),
+            ]
+
+        # Write the reports on worker threads so the event loop stays free
+        await asyncio.gather(
+            *json_writes,
+            asyncio.to_thread(write_csv_report, failures_csv, failed_results),
+            asyncio.to_thread(write_text_report, summary_txt, metadata, failed_results),
         )
-        with open(summary_txt, "w") as f:
-            f.write("COMPREHENSIVE TEST FAILURE ANALYSIS\n")
-            f.write("=" * 50 + "\n\n")
-            f.write(f"Generated: {datetime.now().isoformat()}\n")
-            f.write(f"Total Tests: {len(all_results)}\n")
-            f.write(f"Failed Tests: {len(failed_results)}\n")
-            f.write(
-                f"Success Rate: {(len(all_results) - len(failed_results)) / len(all_results) * 100:.1f}%\n\n"
-            )
-
-            # Group failures by category
-            by_category = {}
-            for failure in failed_results:
-                category = failure["category"]
-                if category not in by_category:
-                    by_category[category] = []
-                by_category[category].append(failure)
-
-            for category, failures in by_category.items():
-                f.write(f"\n{category.upper()} FAILURES ({len(failures)} cases)\n")
-                f.write("-" * 40 + "\n")
-
-                for failure in failures[:10]:  # Show first 10 of each category
-                    f.write(f"\nTest ID: {failure['test_id']}\n")
-                    f.write(f"Chords: {' -> '.join(failure['chords'])}\n")
-                    f.write(f"Description: {failure.get('description', 'N/A')}\n")
-
-                    if "failures" in failure:
-                        for specific in failure["failures"]:
-                            f.write(
-                                f"  - {specific['type']}: Expected={specific.get('expected', 'N/A')}, Actual={specific.get('actual', 'N/A')}\n"
-                            )
-
-                    f.write("\n")
-
-                if len(failures) > 10:
-                    f.write(f"... and {len(failures) - 10} more {category} failures\n")
 
         print(f"\n📁 RESULTS EXPORTED:")
         print(f"  📄 Detailed JSON: {failures_json}")
+        if not self.pretty:
+            print(f"  🗂️  Metadata: {metadata_json}")
         print(f"  📊 Summary CSV: {failures_csv}")
         print(f"  📖 Human-readable: {summary_txt}")
 
 
 async def main():
     """Main execution function"""
-    exporter = TestFailureExporter()
+    exporter = TestFailureExporter(pretty="--pretty" in sys.argv[1:])
     await exporter.run_comprehensive_analysis()
 
 
@@ -0,0 +1,31 @@
+"""
+JSON helpers shared by the analysis scripts.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise, so the scripts run without any extra dependencies.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: bytes) -> Any:
+    """Parse a JSON document from bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(payload: Any, pretty: bool = False) -> bytes:
+    """Encode payload as JSON bytes, stringifying unsupported values"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(payload, option=option, default=str)
+    return json.dumps(payload, indent=2 if pretty else None, default=str).encode()
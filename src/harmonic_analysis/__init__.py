@@ -40,6 +40,7 @@ from .multiple_interpretation_service import (AlternativeAnalysis,
                                               MultipleInterpretationService,
                                               PedagogicalLevel,
                                               analyze_progression_multiple,
+                                              analyze_progressions_multiple,
                                               multiple_interpretation_service)
 # Scale data and constants
 from .scales import (MAJOR_SCALE_MODES, MODAL_PARENT_KEYS, PITCH_CLASS_NAMES,
@@ -104,6 +105,7 @@ __all__ = [
     "InterpretationType",
     "PedagogicalLevel",
     "analyze_progression_multiple",
+    "analyze_progressions_multiple",
     "multiple_interpretation_service",
     # Types
     "UserInputContext",
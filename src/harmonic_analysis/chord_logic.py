@@ -4,11 +4,33 @@ Chord parsing and logic for music theory analysis.
 
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from .scales import NOTE_TO_PITCH_CLASS
 from .types import ChordFunction
 
+# Simplified harmonic function of each diatonic scale degree, by mode
+SCALE_DEGREE_FUNCTIONS: Dict[str, Dict[int, ChordFunction]] = {
+    "major": {
+        0: ChordFunction.TONIC,  # I
+        2: ChordFunction.PREDOMINANT,  # ii
+        4: ChordFunction.TONIC,  # iii (relative minor)
+        5: ChordFunction.SUBDOMINANT,  # IV
+        7: ChordFunction.DOMINANT,  # V
+        9: ChordFunction.TONIC,  # vi (relative minor)
+        11: ChordFunction.LEADING_TONE,  # vii°
+    },
+    "minor": {
+        0: ChordFunction.TONIC,  # i
+        2: ChordFunction.PREDOMINANT,  # ii°
+        3: ChordFunction.TONIC,  # III
+        5: ChordFunction.SUBDOMINANT,  # iv
+        7: ChordFunction.DOMINANT,  # V
+        8: ChordFunction.SUBDOMINANT,  # VI
+        10: ChordFunction.SUBDOMINANT,  # VII
+    },
+}
+
 
 @dataclass
 class ChordMatch:
@@ -225,26 +247,5 @@ def determine_chord_function(
     # Calculate scale degree
     scale_degree = (chord_pitch - key_pitch) % 12
 
-    # Simplified function mapping
-    if mode == "major":
-        function_map = {
-            0: ChordFunction.TONIC,  # I
-            2: ChordFunction.PREDOMINANT,  # ii
-            4: ChordFunction.TONIC,  # iii (relative minor)
-            5: ChordFunction.SUBDOMINANT,  # IV
-            7: ChordFunction.DOMINANT,  # V
-            9: ChordFunction.TONIC,  # vi (relative minor)
-            11: ChordFunction.LEADING_TONE,  # vii°
-        }
-    else:  # minor mode
-        function_map = {
-            0: ChordFunction.TONIC,  # i
-            2: ChordFunction.PREDOMINANT,  # ii°
-            3: ChordFunction.TONIC,  # III
-            5: ChordFunction.SUBDOMINANT,  # iv
-            7: ChordFunction.DOMINANT,  # V
-            8: ChordFunction.SUBDOMINANT,  # VI
-            10: ChordFunction.SUBDOMINANT,  # VII
-        }
-
+    function_map = SCALE_DEGREE_FUNCTIONS["major" if mode == "major" else "minor"]
     return function_map.get(scale_degree, ChordFunction.CHROMATIC)
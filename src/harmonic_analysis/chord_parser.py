@@ -11,7 +11,7 @@ Comprehensive chord detection and analysis including:
 """
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 
 # Pitch class to note name mapping
@@ -44,6 +44,9 @@ NOTE_TO_PITCH_CLASS = {
     "Cb": 11,
 }
 
+# Unicode accidentals normalized to their ASCII spelling before lookup
+ACCIDENTAL_TRANSLATION = str.maketrans({"♯": "#", "♭": "b"})
+
 
 @dataclass
 class ChordTemplate:
@@ -54,6 +57,11 @@ class ChordTemplate:
     name: str
     min_notes: int = 3
     confidence: float = 1.0
+    # 12-bit interval mask, bit n set when interval n is in the template
+    mask: int = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.mask = sum(1 << interval for interval in self.intervals)
 
 
 @dataclass
@@ -77,6 +85,11 @@ class ChordMatch:
 class ChordParser:
     """Comprehensive chord parsing and detection"""
 
+    # Regex patterns for chord symbol parsing
+    ROOT_PATTERN = re.compile(r"^([A-G][#b♯♭]?)")
+    BASS_PATTERN = re.compile(r"/([A-G][#b♯♭]?)")
+    ADD_PATTERN = re.compile(r"add(\d+)")
+
     def __init__(self):
         # Define chord templates
         self.chord_templates = {
@@ -145,8 +158,7 @@ class ChordParser:
             return []  # Need at least 2 notes for chord analysis
 
         # Convert to pitch classes and remove duplicates
-        pitch_classes = list(set(note % 12 for note in note_numbers))
-        pitch_classes.sort()
+        pitch_classes = sorted({note % 12 for note in note_numbers})
 
         matches = []
 
@@ -154,6 +166,7 @@ class ChordParser:
         for root_pitch in pitch_classes:
             # Calculate intervals from this root
             intervals = [(pc - root_pitch + 12) % 12 for pc in pitch_classes]
+            interval_mask = sum(1 << interval for interval in intervals)
 
             # Check against each chord template
             for chord_type, template in self.chord_templates.items():
@@ -166,7 +179,8 @@ class ChordParser:
                 # Special handling for 3-note patterns
                 has_all_intervals = self._check_pattern_match(
                     intervals,
-                    template.intervals,
+                    interval_mask,
+                    template.mask,
                     pitch_classes,
                     root_pitch,
                     chord_type,
@@ -180,6 +194,7 @@ class ChordParser:
                     # Calculate confidence
                     confidence = self._calculate_confidence(
                         intervals,
+                        interval_mask,
                         template.intervals,
                         len(note_numbers),
                         chord_type,
@@ -227,7 +242,8 @@ class ChordParser:
     def _check_pattern_match(
         self,
         intervals: List[int],
-        template_intervals: List[int],
+        interval_mask: int,
+        template_mask: int,
         pitch_classes: List[int],
         root_pitch: int,
         chord_type: str,
@@ -236,9 +252,7 @@ class ChordParser:
         """Check if intervals match template with special pattern handling"""
 
         # Basic check - all template intervals present
-        has_all_intervals = all(
-            interval in intervals for interval in template_intervals
-        )
+        has_all_intervals = (template_mask & ~interval_mask) == 0
 
         # Special handling for 3-note patterns
         if note_count == 3:
@@ -279,6 +293,7 @@ class ChordParser:
     def _calculate_confidence(
         self,
         played_intervals: List[int],
+        played_mask: int,
         template_intervals: List[int],
         note_count: int,
         chord_type: str,
@@ -287,9 +302,7 @@ class ChordParser:
         """Calculate confidence score for chord match"""
 
         total_template_notes = len(template_intervals)
-        matching_notes = sum(
-            1 for interval in template_intervals if interval in played_intervals
-        )
+        matching_notes = bin(played_mask & template.mask).count("1")
         extra_notes = len(played_intervals) - total_template_notes
 
         # Use predefined confidence from template if available
@@ -478,14 +491,12 @@ class ChordParser:
         clean_symbol = symbol.strip()
 
         # Extract root note
-        root_match = re.match(r"^([A-G][#b♯♭]?)", clean_symbol)
+        root_match = self.ROOT_PATTERN.match(clean_symbol)
         if not root_match:
             return None
 
-        root_note = root_match.group(1)
-
         # Normalize sharps and flats
-        root_note = root_note.replace("♯", "#").replace("♭", "b")
+        root_note = root_match.group(1).translate(ACCIDENTAL_TRANSLATION)
 
         # Get pitch class
         pitch_class = NOTE_TO_PITCH_CLASS.get(root_note)
@@ -501,9 +512,9 @@ class ChordParser:
         # Extract bass note if present (for inversions)
         bass_note = None
         if "/" in remainder:
-            bass_match = re.search(r"/([A-G][#b♯♭]?)", remainder)
+            bass_match = self.BASS_PATTERN.search(remainder)
             if bass_match:
-                bass_note = bass_match.group(1).replace("♯", "#").replace("♭", "b")
+                bass_note = bass_match.group(1).translate(ACCIDENTAL_TRANSLATION)
                 remainder = remainder[: remainder.index("/")]
 
         # Extract extensions
@@ -565,8 +576,9 @@ class ChordParser:
             extensions.append("11")
         if "13" in suffix:
             extensions.append("13")
-        if "add" in suffix.lower():
-            add_match = re.search(r"add(\d+)", suffix.lower())
+        suffix_lower = suffix.lower()
+        if "add" in suffix_lower:
+            add_match = self.ADD_PATTERN.search(suffix_lower)
             if add_match:
                 extensions.append(f"add{add_match.group(1)}")
 
@@ -587,8 +599,7 @@ class ChordParser:
             return []
 
         matches = []
-        pitch_classes = list(set(note % 12 for note in note_numbers))
-        pitch_classes.sort()
+        pitch_classes = sorted({note % 12 for note in note_numbers})
 
         # Try each pitch class as root
         for root_pitch in pitch_classes:
@@ -662,14 +673,16 @@ def parse_chord_progression(input_str: str) -> List[str]:
     ]
 
 
+# Parser reused by find_chords_from_midi and parse_chord
+_default_parser = ChordParser()
+
+
 # Convenience functions for common use cases
 def find_chords_from_midi(midi_notes: List[int]) -> List[ChordMatch]:
     """Find chord matches from MIDI note numbers"""
-    parser = ChordParser()
-    return parser.find_chord_matches(midi_notes)
+    return _default_parser.find_chord_matches(midi_notes)
 
 
 def parse_chord(symbol: str) -> Optional[Dict[str, any]]:
     """Parse a chord symbol"""
-    parser = ChordParser()
-    return parser.parse_chord_symbol(symbol)
+    return _default_parser.parse_chord_symbol(symbol)
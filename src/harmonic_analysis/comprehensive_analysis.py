@@ -9,8 +9,8 @@ from .chord_logic import parse_chord_progression
 from .functional_harmony import (FunctionalAnalysisResult,
                                  FunctionalHarmonyAnalyzer)
 from .modal_analysis import EnhancedModalAnalyzer, ModalAnalysisResult
-from .types import (AnalysisOptions, MultipleInterpretationResult,
-                    UserInputContext)
+from .types import (AnalysisOptions, Evidence, Interpretation,
+                    MultipleInterpretationResult, UserInputContext)
 
 
 @dataclass
@@ -163,8 +163,6 @@ class ComprehensiveAnalysisEngine:
         options: AnalysisOptions,
     ) -> MultipleInterpretationResult:
         """Convert comprehensive result to multiple interpretation format."""
-        from .types import Evidence, Interpretation
-
         chord_symbols = self._parse_chord_progression(progression_input)
 
         # Create primary interpretation
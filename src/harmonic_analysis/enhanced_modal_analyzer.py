@@ -10,11 +10,89 @@ Key Improvements:
 - Evidence-based confidence scoring
 """
 
+import logging
 import re
+from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, List, Optional
 
+logger = logging.getLogger(__name__)
+
+# Substrings marking a Roman numeral as modal rather than purely functional.
+# "II" also covers bII, bIII and bVII.
+MODAL_CHARACTERISTIC_MARKERS = ("II", "#IV", "bVI")
+
+# Roman numerals as (major, minor, diminished), indexed by semitones above tonic
+MODAL_ROMAN_NUMERALS = (
+    ("I", "i", "i°"),
+    ("bII", "bii", "bii°"),
+    ("II", "ii", "ii°"),
+    ("bIII", "biii", "biii°"),
+    ("III", "iii", "iii°"),
+    ("IV", "iv", "iv°"),
+    ("#IV", "#iv", "#iv°"),
+    ("V", "v", "v°"),
+    ("bVI", "bvi", "bvi°"),
+    ("VI", "vi", "vi°"),
+    ("bVII", "bvii", "bvii°"),
+    ("VII", "vii", "vii°"),
+)
+
+# Diatonic Roman numerals by interval above the key center, keyed by
+# is_minor_key; case and ° reflect the chord quality expected at each degree
+FUNCTIONAL_ROMAN_NUMERALS = {
+    False: {0: "I", 2: "ii", 4: "iii", 5: "IV", 7: "V", 9: "vi", 11: "vii°"},
+    True: {0: "i", 2: "ii°", 4: "III", 5: "iv", 7: "v", 9: "VI", 11: "VII"},
+}
+
+# Exact progressions that are purely functional, with their strength
+PURE_FUNCTIONAL_PATTERNS = {
+    "I-V-I": 0.95,
+    "I-IV-V-I": 0.95,
+    "ii-V-I": 0.85,
+    "vi-IV-I-V": 0.90,
+}
+
+# Progressions that resemble modal patterns but should reduce modal confidence
+MODAL_FOIL_PATTERNS = frozenset(
+    (
+        "I-V-I",  # Pure functional - any mode
+        "I-IV-V-I",  # Pure functional progression
+        "ii-V-I",  # Jazz ii-V-I - purely functional
+        "vi-IV-I-V",  # Pop progression - functional
+        "i-iv-i",  # Dorian foil: minor iv suggests Aeolian, not Dorian
+        "i-II-i",  # Phrygian foil: natural II undermines characteristic bII
+        "i-V-i",  # Minor authentic cadence - functional, not modal
+        "i-v-i",  # Natural minor (Aeolian) - not other minor modes
+        "i°-V-i°",  # Locrian foil: functional V resolution in diminished contexts
+    )
+)
+
+# Two-chord vamps and the (description, strength) of the evidence they provide
+MODAL_VAMP_PATTERNS = {
+    "I-IV": ("I-IV vamp pattern (characteristic of Ionian modal color)", 0.7),
+    "i-IV": ("i-IV vamp pattern (characteristic of Dorian modal color)", 0.8),
+    "I-bVII": (
+        "I-bVII vamp pattern (characteristic of Mixolydian modal color)",
+        0.85,
+    ),
+    "i-bII": ("i-bII vamp pattern (characteristic of Phrygian modal color)", 0.85),
+    "I-II": ("I-II vamp pattern (characteristic of Lydian modal color)", 0.8),
+}
+
+# Mode implied by the tonic's interval above the parent key root
+PARENT_KEY_MODES = {
+    0: "Ionian",
+    2: "Dorian",
+    4: "Phrygian",
+    5: "Lydian",
+    7: "Mixolydian",
+    9: "Aeolian",
+    11: "Locrian",
+}
+
 
 class EvidenceType(Enum):
     STRUCTURAL = "structural"
@@ -94,6 +172,12 @@ class EnhancedModalAnalyzer:
         "B": 11,
     }
 
+    # Precompiled patterns for chord symbol and Roman numeral handling
+    ROOT_PATTERN = re.compile(r"^([A-G][#b]?)")
+    MINOR_QUALITY_PATTERN = re.compile(r"^m(?!aj)")
+    EXTENSION_PATTERN = re.compile(r"7|maj7|m7|ø7|°7|sus|add|dim")
+    EXTENSION_MARKERS = ("7", "sus", "add", "dim")
+
     def __init__(self):
         # Functional patterns that should NOT be detected as modal
         self.functional_patterns = [
@@ -173,10 +257,14 @@ class EnhancedModalAnalyzer:
         if not chord_symbols:
             return None
 
+        # Parse each chord once; the functional pre-screen and the modal
+        # analysis below share the result (None marks an unparseable symbol)
+        parsed_chords = self._parse_chords(chord_symbols)
+
         # FUNCTIONAL HARMONY PRE-SCREENING
         if parent_key:
             functional_roman_numerals = self._generate_functional_roman_numerals(
-                chord_symbols, parent_key
+                parsed_chords, parent_key
             )
             if functional_roman_numerals:
                 functional_strength = self._detect_functional_patterns(
@@ -193,15 +281,7 @@ class EnhancedModalAnalyzer:
         if all(chord == chord_symbols[0] for chord in chord_symbols):
             return None  # All same chord - static harmony, not modal
 
-        # Parse chords with error handling
-        chord_analyses = []
-        for symbol in chord_symbols:
-            try:
-                analysis = self._parse_chord(symbol)
-                chord_analyses.append(analysis)
-            except Exception as e:
-                print(f"Warning: Failed to parse chord symbol: {symbol} - {e}")
-                continue
+        chord_analyses = [chord for chord in parsed_chords if chord is not None]
 
         # Check if we have enough valid chords after parsing
         if len(chord_analyses) < 2:
@@ -249,22 +329,22 @@ class EnhancedModalAnalyzer:
         self, chord_analyses: List[ChordAnalysis], parent_key: Optional[str] = None
     ) -> List[Dict[str, str]]:
         """Detect potential tonal centers based on structural analysis"""
-        candidates = {}
+        candidates: Dict[str, float] = defaultdict(float)
 
         # Heavily weight first and last chords (structural importance)
         first_chord = chord_analyses[0]
         last_chord = chord_analyses[-1]
 
-        candidates[first_chord.root] = candidates.get(first_chord.root, 0) + 3.0
-        candidates[last_chord.root] = candidates.get(last_chord.root, 0) + 3.0
+        candidates[first_chord.root] += 3.0
+        candidates[last_chord.root] += 3.0
 
         # If first and last are the same, give massive weight
         if first_chord.root == last_chord.root:
-            candidates[first_chord.root] = candidates.get(first_chord.root, 0) + 5.0
+            candidates[first_chord.root] += 5.0
 
         # Weight other chords less
         for chord in chord_analyses:
-            candidates[chord.root] = candidates.get(chord.root, 0) + 0.5
+            candidates[chord.root] += 0.5
 
         # Sort candidates by weight
         sorted_candidates = sorted(candidates.items(), key=lambda x: x[1], reverse=True)
@@ -366,62 +446,34 @@ class EnhancedModalAnalyzer:
         interval = (chord.pitch_class - tonic_pitch_class + 12) % 12
 
         # Determine base Roman numeral based on interval and chord quality
-        base_roman_numerals = {
-            0: {"major": "I", "minor": "i", "diminished": "i°"},
-            1: {"major": "bII", "minor": "bii", "diminished": "bii°"},
-            2: {"major": "II", "minor": "ii", "diminished": "ii°"},
-            3: {"major": "bIII", "minor": "biii", "diminished": "biii°"},
-            4: {"major": "III", "minor": "iii", "diminished": "iii°"},
-            5: {"major": "IV", "minor": "iv", "diminished": "iv°"},
-            6: {"major": "#IV", "minor": "#iv", "diminished": "#iv°"},
-            7: {"major": "V", "minor": "v", "diminished": "v°"},
-            8: {"major": "bVI", "minor": "bvi", "diminished": "bvi°"},
-            9: {"major": "VI", "minor": "vi", "diminished": "vi°"},
-            10: {"major": "bVII", "minor": "bvii", "diminished": "bvii°"},
-            11: {"major": "VII", "minor": "vii", "diminished": "vii°"},
-        }
-
-        roman_options = base_roman_numerals.get(interval)
-        if not roman_options:
-            return f"?{interval}"
+        major, minor, diminished = MODAL_ROMAN_NUMERALS[interval]
 
         # Choose appropriate Roman numeral based on chord quality
-        if chord.quality in ["major", "major7", "dominant7"]:
-            return roman_options["major"]
-        elif chord.quality in ["minor", "minor7"]:
-            return roman_options["minor"]
-        elif chord.quality in ["diminished", "half_diminished"]:
-            return roman_options["diminished"]
+        if chord.quality in ("major", "major7", "dominant7"):
+            return major
+        elif chord.quality in ("minor", "minor7"):
+            return minor
+        elif chord.quality in ("diminished", "half_diminished"):
+            return diminished
         elif chord.quality == "augmented":
-            return roman_options["major"] + "+"
+            return major + "+"
         elif chord.quality == "suspended":
-            return roman_options["major"] + "sus"
+            return major + "sus"
         else:
             # Default to major/minor based on interval position
-            return roman_options["major"] if interval == 0 else roman_options["minor"]
+            return major if interval == 0 else minor
 
     def _detect_modal_patterns(self, roman_numerals: List[str]) -> List[Dict]:
         """Detect known modal patterns in Roman numeral sequence"""
         roman_string = "-".join(roman_numerals)
-        results = []
 
-        for pattern in self.modal_patterns:
-            if pattern.pattern in roman_string:
-                results.append({"pattern": pattern, "matches": 1})
-
-            # Check for partial matches
-            pattern_parts = pattern.pattern.split("-")
-            partial_matches = 0
-
-            for i in range(len(roman_numerals) - len(pattern_parts) + 1):
-                segment = "-".join(roman_numerals[i : i + len(pattern_parts)])
-                if segment == pattern.pattern:
-                    partial_matches += 1
-
-            if partial_matches > 0 and not any(
-                r["pattern"].pattern == pattern.pattern for r in results
-            ):
-                results.append({"pattern": pattern, "matches": partial_matches})
+        # Any aligned segment equal to the pattern is also a substring of the
+        # joined progression, so the substring test alone decides the match.
+        results = [
+            {"pattern": pattern, "matches": 1}
+            for pattern in self.modal_patterns
+            if pattern.pattern in roman_string
+        ]
 
         return sorted(
             results, key=lambda x: x["pattern"].strength * x["matches"], reverse=True
@@ -511,31 +563,8 @@ class EnhancedModalAnalyzer:
         # Vamp pattern evidence
         roman_string = "-".join(roman_numerals)
         if len(chord_analyses) == 2:
-            vamp_patterns = {
-                "I-IV": (
-                    "I-IV vamp pattern (characteristic of Ionian modal color)",
-                    0.7,
-                ),
-                "i-IV": (
-                    "i-IV vamp pattern (characteristic of Dorian modal color)",
-                    0.8,
-                ),
-                "I-bVII": (
-                    "I-bVII vamp pattern (characteristic of Mixolydian modal color)",
-                    0.85,
-                ),
-                "i-bII": (
-                    "i-bII vamp pattern (characteristic of Phrygian modal color)",
-                    0.85,
-                ),
-                "I-II": (
-                    "I-II vamp pattern (characteristic of Lydian modal color)",
-                    0.8,
-                ),
-            }
-
-            if roman_string in vamp_patterns:
-                description, strength = vamp_patterns[roman_string]
+            if roman_string in MODAL_VAMP_PATTERNS:
+                description, strength = MODAL_VAMP_PATTERNS[roman_string]
                 evidence.append(
                     ModalEvidence(
                         type=EvidenceType.STRUCTURAL,
@@ -546,8 +575,19 @@ class EnhancedModalAnalyzer:
 
         return evidence
 
+    def _parse_chords(self, chord_symbols: List[str]) -> List[Optional[ChordAnalysis]]:
+        """Parse chord symbols, using None for symbols that fail to parse"""
+        parsed_chords: List[Optional[ChordAnalysis]] = []
+        for symbol in chord_symbols:
+            try:
+                parsed_chords.append(self._parse_chord(symbol))
+            except Exception as e:
+                logger.debug("Failed to parse chord symbol: %s - %s", symbol, e)
+                parsed_chords.append(None)
+        return parsed_chords
+
     def _generate_functional_roman_numerals(
-        self, chord_symbols: List[str], parent_key: str
+        self, chord_analyses: List[Optional[ChordAnalysis]], parent_key: str
     ) -> Optional[List[str]]:
         """Generate Roman numerals relative to parent key (for functional analysis)"""
         try:
@@ -560,18 +600,16 @@ class EnhancedModalAnalyzer:
             is_minor_key = "minor" in parent_key
 
             # Generate Roman numerals with proper functional harmony chord qualities
-            result = []
-            for chord_symbol in chord_symbols:
-                try:
-                    chord = self._parse_chord(chord_symbol)
-                    roman = self._generate_functional_roman_numeral(
+            return [
+                (
+                    self._generate_functional_roman_numeral(
                         chord, parent_key_pitch_class, is_minor_key
                     )
-                    result.append(roman)
-                except Exception:
-                    result.append("?")
-
-            return result
+                    if chord is not None
+                    else "?"
+                )
+                for chord in chord_analyses
+            ]
         except Exception:
             return None
 
@@ -581,128 +619,56 @@ class EnhancedModalAnalyzer:
         """Generate Roman numeral with proper functional harmony chord qualities"""
         interval = (chord.pitch_class - tonic_pitch_class + 12) % 12
 
-        # Define diatonic chord qualities for major and minor keys
-        major_key_qualities = [
-            "major",
-            "minor",
-            "minor",
-            "major",
-            "major",
-            "minor",
-            "diminished",
-        ]
-        minor_key_qualities = [
-            "minor",
-            "diminished",
-            "major",
-            "minor",
-            "minor",
-            "major",
-            "major",
-        ]
-
-        expected_qualities = (
-            minor_key_qualities if is_minor_key else major_key_qualities
-        )
-
-        # Map intervals to scale degrees
-        scale_degree_mappings = [
-            (0, 0),
-            (2, 1),
-            (4, 2),
-            (5, 3),
-            (7, 4),
-            (9, 5),
-            (11, 6),
-        ]
-
-        # Find the scale degree for this interval
-        mapping = next(
-            (mapping for mapping in scale_degree_mappings if mapping[0] == interval),
-            None,
-        )
-
-        if not mapping:
+        roman_numeral = FUNCTIONAL_ROMAN_NUMERALS[is_minor_key].get(interval)
+        if roman_numeral is None:
             # Chromatic chord - use modal approach
             return self._generate_modal_roman_numeral(chord, tonic_pitch_class)
 
-        scale_degree = mapping[1]
-        expected_quality = expected_qualities[scale_degree]
-
-        # Roman numeral symbols
-        roman_numerals = ["I", "II", "III", "IV", "V", "VI", "VII"]
-        roman_numeral = roman_numerals[scale_degree]
-
-        # Adjust case based on expected quality
-        if expected_quality in ["minor", "diminished"]:
-            roman_numeral = roman_numeral.lower()
-
-        # Add diminished symbol
-        if expected_quality == "diminished":
-            roman_numeral += "°"
-
         return roman_numeral
 
     def _detect_functional_patterns(self, roman_numerals: List[str]) -> float:
         """Detect functional patterns in Roman numeral sequence"""
         progression = "-".join(roman_numerals)
 
-        # Only detect PURE functional patterns without modal characteristics
-        pure_functional_patterns = [
-            {"pattern": "I-V-I", "strength": 0.95},
-            {"pattern": "I-IV-V-I", "strength": 0.95},
-            {"pattern": "ii-V-I", "strength": 0.85},
-            {"pattern": "vi-IV-I-V", "strength": 0.90},
-        ]
-
-        # Check if progression contains modal characteristics
+        # Check if progression contains modal characteristics. Markers can't
+        # span the "-" separators, so one scan of the joined string suffices.
         has_modal_characteristics = any(
-            "bVII" in rn
-            or "bII" in rn
-            or "II" in rn
-            or "#IV" in rn
-            or "bVI" in rn
-            or "bIII" in rn
-            for rn in roman_numerals
+            marker in progression for marker in MODAL_CHARACTERISTIC_MARKERS
         )
 
         if has_modal_characteristics:
             return 0  # Modal characteristics present - not purely functional
 
-        # Only flag exact matches of pure functional progressions
-        for pattern in pure_functional_patterns:
-            if progression == pattern["pattern"]:
-                return pattern["strength"]
-
-        return 0  # No pure functional patterns detected
+        # Only flag exact matches of PURE functional progressions
+        return PURE_FUNCTIONAL_PATTERNS.get(progression, 0)
 
     def _detect_foil_patterns(self, roman_numerals: List[str]) -> bool:
         """Detect foil patterns that should have reduced modal confidence"""
-        progression = "-".join(roman_numerals)
+        return self._is_foil_progression("-".join(roman_numerals))
 
-        # Normalize roman numerals by removing chord extensions
-        normalized_roman_numerals = [
-            re.sub(r"7|maj7|m7|ø7|°7|sus|add|dim", "", rn) for rn in roman_numerals
-        ]
-        normalized_progression = "-".join(normalized_roman_numerals)
-
-        # Modal foil patterns
-        modal_foil_patterns = [
-            "I-V-I",  # Pure functional - any mode
-            "I-IV-V-I",  # Pure functional progression
-            "ii-V-I",  # Jazz ii-V-I - purely functional
-            "vi-IV-I-V",  # Pop progression - functional
-            "i-iv-i",  # Dorian foil: minor iv suggests Aeolian, not Dorian
-            "i-II-i",  # Phrygian foil: natural II undermines characteristic bII
-            "i-V-i",  # Minor authentic cadence - functional, not modal
-            "i-v-i",  # Natural minor (Aeolian) - not other minor modes
-            "i°-V-i°",  # Locrian foil: functional V resolution in diminished contexts
-        ]
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _is_foil_progression(progression: str) -> bool:
+        """Check a joined Roman numeral progression against the foil patterns
 
-        return any(
-            pattern in [progression, normalized_progression]
-            for pattern in modal_foil_patterns
+        Each candidate is checked once while it is scored and again during
+        candidate selection, so results are cached by progression string.
+        """
+        if progression in MODAL_FOIL_PATTERNS:
+            return True
+
+        # Normalize roman numerals by removing chord extensions. Every
+        # alternative in the pattern contains one of these markers, so plain
+        # progressions can skip the regex entirely. No alternative contains
+        # "-", so substituting over the joined string is per-numeral.
+        if not any(
+            marker in progression for marker in EnhancedModalAnalyzer.EXTENSION_MARKERS
+        ):
+            return False
+        normalized_progression = EnhancedModalAnalyzer.EXTENSION_PATTERN.sub(
+            "", progression
         )
+        return normalized_progression in MODAL_FOIL_PATTERNS
 
     def _calculate_confidence(
         self,
@@ -716,10 +682,11 @@ class EnhancedModalAnalyzer:
         if not evidence:
             return 0.0
 
-        # Check for functional patterns first
-        functional_strength = 0
-        if roman_numerals:
-            functional_strength = self._detect_functional_patterns(roman_numerals)
+        # Block modal analysis if clear functional patterns detected
+        if roman_numerals and self._detect_functional_patterns(roman_numerals) > 0.8:
+            return 0  # Don't analyze clear functional progressions as modal
+
+        roman_string = "-".join(roman_numerals) if roman_numerals else ""
 
         # Base confidence from evidence
         evidence_strength = sum(e.strength for e in evidence) / len(evidence)
@@ -732,12 +699,13 @@ class EnhancedModalAnalyzer:
                 best_pattern["pattern"].strength * best_pattern["matches"] * 0.3
             )
 
+        # Structural and consistency bonuses both derive from the evidence types
+        evidence_types = {e.type for e in evidence}
+
         # Structural bonus for strong evidence
-        structural_evidence = [e for e in evidence if e.type == EvidenceType.STRUCTURAL]
-        structural_bonus = 0.1 if structural_evidence else 0
+        structural_bonus = 0.1 if EvidenceType.STRUCTURAL in evidence_types else 0
 
         # Consistency bonus for multiple types of evidence
-        evidence_types = set(e.type for e in evidence)
         consistency_bonus = 0.1 if len(evidence_types) > 1 else 0
 
         base_confidence = (
@@ -754,26 +722,20 @@ class EnhancedModalAnalyzer:
         if len(evidence_types) >= 2 and evidence_strength > 0.7:
             base_confidence = max(base_confidence, 0.72)
 
-        # Block modal analysis if clear functional patterns detected
-        if functional_strength > 0.8:
-            return 0  # Don't analyze clear functional progressions as modal
-
         # Special handling for vamp patterns (two-chord progressions)
         if chord_analyses and len(chord_analyses) == 2:
             if pattern_results:
                 vamp_pattern = pattern_results[0]
                 if vamp_pattern["pattern"].pattern in ["I-IV", "i-IV"]:
                     base_confidence = max(base_confidence, 0.72)
-            elif roman_numerals and "-".join(roman_numerals) in ["I-IV", "i-IV"]:
+            elif roman_string in ["I-IV", "i-IV"]:
                 base_confidence = max(base_confidence, 0.70)
 
         # Boost confidence for clear modal patterns
-        if roman_numerals:
-            roman_string = "-".join(roman_numerals)
-            if roman_string == "I-IV-I":
-                base_confidence = max(base_confidence, 0.78)
-            elif roman_string in ["i-IV-i", "I-bVII-I"]:
-                base_confidence = max(base_confidence, 0.75)
+        if roman_string == "I-IV-I":
+            base_confidence = max(base_confidence, 0.78)
+        elif roman_string in ["i-IV-i", "I-bVII-I"]:
+            base_confidence = max(base_confidence, 0.75)
 
         return min(base_confidence, 0.95)
 
@@ -787,6 +749,18 @@ class EnhancedModalAnalyzer:
         chord_analyses: List[ChordAnalysis],
     ) -> str:
         """Determine mode name based on analysis"""
+        # Gather tonic chord qualities and Roman numerals once so the checks
+        # below are set lookups rather than repeated scans
+        tonic_pitch_class = self.NOTE_TO_PITCH_CLASS[tonic]
+        tonic_qualities = {
+            chord.quality
+            for chord in chord_analyses
+            if chord.pitch_class == tonic_pitch_class
+        }
+        has_dominant7_tonic = "dominant7" in tonic_qualities
+        has_half_diminished7_tonic = "half_diminished" in tonic_qualities
+        roman_set = set(roman_numerals)
+        has_major_iv = "IV" in roman_set
 
         # PRIORITY 1: Pattern-based mode detection (most reliable)
         if pattern_results:
@@ -808,21 +782,6 @@ class EnhancedModalAnalyzer:
                 if interval == 0:
                     return f"{tonic} Ionian"
 
-            # Check 7th chord qualities before returning pattern-based mode
-            tonic_pitch_class = self.NOTE_TO_PITCH_CLASS[tonic]
-            tonic_chords = [
-                chord
-                for chord in chord_analyses
-                if chord.pitch_class == tonic_pitch_class
-            ]
-            has_dominant7_tonic = any(
-                chord.quality == "dominant7" for chord in tonic_chords
-            )
-            has_half_diminished7_tonic = any(
-                chord.quality == "half_diminished" for chord in tonic_chords
-            )
-            has_major_iv = "IV" in roman_numerals
-
             # 7th chord qualities provide more specific mode identification
             if has_half_diminished7_tonic:
                 return f"{tonic} Locrian"
@@ -838,29 +797,18 @@ class EnhancedModalAnalyzer:
 
         # Check Roman numerals for chord quality clues
         roman_string = "-".join(roman_numerals)
-        has_minor_tonic = any(rn in ["i", "i7", "im7"] for rn in roman_numerals)
-        has_major_tonic = any(rn in ["I", "I7", "Imaj7"] for rn in roman_numerals)
-        has_major_iv = "IV" in roman_numerals
-        has_minor_iv = "iv" in roman_numerals
+        has_minor_tonic = not roman_set.isdisjoint(("i", "i7", "im7"))
+        has_major_tonic = not roman_set.isdisjoint(("I", "I7", "Imaj7"))
+        has_minor_iv = "iv" in roman_set
         has_diminished_tonic = "i°" in roman_string
 
         # Check actual chord qualities
-        tonic_pitch_class = self.NOTE_TO_PITCH_CLASS[tonic]
-        tonic_chords = [
-            chord for chord in chord_analyses if chord.pitch_class == tonic_pitch_class
-        ]
-        has_dominant7_tonic = any(
-            chord.quality == "dominant7" for chord in tonic_chords
-        )
-        has_half_diminished7_tonic = any(
-            chord.quality == "half_diminished" for chord in tonic_chords
-        )
-        has_major7_tonic = any(chord.quality == "major7" for chord in tonic_chords)
+        has_major7_tonic = "major7" in tonic_qualities
 
-        has_flat7_chord = "bVII" in roman_numerals
-        has_flat2_chord = "bII" in roman_numerals
-        has_natural2_chord = "II" in roman_numerals
-        has_flat6_chord = "bVI" in roman_numerals
+        has_flat7_chord = "bVII" in roman_set
+        has_flat2_chord = "bII" in roman_set
+        has_natural2_chord = "II" in roman_set
+        has_flat6_chord = "bVI" in roman_set
 
         # PRIORITY 1: 7th chord quality discrimination
         if has_half_diminished7_tonic:
@@ -909,17 +857,7 @@ class EnhancedModalAnalyzer:
                 + 12
             ) % 12
 
-            mode_map = {
-                0: "Ionian",
-                2: "Dorian",
-                4: "Phrygian",
-                5: "Lydian",
-                7: "Mixolydian",
-                9: "Aeolian",
-                11: "Locrian",
-            }
-
-            mode_name = mode_map.get(interval)
+            mode_name = PARENT_KEY_MODES.get(interval)
             if mode_name:
                 # For ambiguous cases, prioritize parent key context
                 if (
@@ -969,14 +907,20 @@ class EnhancedModalAnalyzer:
 
         return characteristics
 
-    def _parse_chord(self, symbol: str) -> ChordAnalysis:
-        """Parse chord symbol into components"""
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _parse_chord(symbol: str) -> ChordAnalysis:
+        """Parse chord symbol into components
+
+        Parsing depends only on the symbol, so results are cached and shared
+        across calls and analyzer instances; callers must not mutate them.
+        """
         clean_symbol = symbol.strip()
         if not clean_symbol:
             raise ValueError("Empty chord symbol")
 
         # Extract root note (handles sharps and flats)
-        root_match = re.match(r"^([A-G][#b]?)", clean_symbol)
+        root_match = EnhancedModalAnalyzer.ROOT_PATTERN.match(clean_symbol)
         if not root_match:
             raise ValueError(f"Cannot parse chord: {symbol} - invalid root note")
 
@@ -999,12 +943,12 @@ class EnhancedModalAnalyzer:
             quality = "minor7"
         elif "7" in remainder:
             quality = "dominant7"
-        elif re.match(r"^m(?!aj)", remainder):
+        elif EnhancedModalAnalyzer.MINOR_QUALITY_PATTERN.match(remainder):
             quality = "minor"
         elif "sus2" in remainder or "sus4" in remainder:
             quality = "suspended"
 
-        pitch_class = self.NOTE_TO_PITCH_CLASS.get(root)
+        pitch_class = EnhancedModalAnalyzer.NOTE_TO_PITCH_CLASS.get(root)
         if pitch_class is None:
             raise ValueError(f"Unknown root note: {root}")
 
@@ -1019,10 +963,15 @@ class EnhancedModalAnalyzer:
 
     def _extract_key_root(self, key_signature: str) -> str:
         """Extract root note from key signature string"""
-        match = re.match(r"^([A-G][#b]?)", key_signature)
+        match = self.ROOT_PATTERN.match(key_signature)
         return match.group(1) if match else "C"
 
 
+# Shared instance for the convenience function; the analyzer holds only
+# read-only pattern tables, so there is no need to rebuild it per call
+_default_analyzer = EnhancedModalAnalyzer()
+
+
 # Convenience function export to match dynamic import expectations
 async def analyze_modal_progression(
     chords: List[str], parent_key: Optional[str] = None
@@ -1037,5 +986,4 @@ async def analyze_modal_progression(
     Returns:
         ModalAnalysisResult if modal characteristics detected, None otherwise
     """
-    analyzer = EnhancedModalAnalyzer()
-    return analyzer.analyze_modal_characteristics(chords, parent_key)
+    return _default_analyzer.analyze_modal_characteristics(chords, parent_key)
@@ -6,10 +6,11 @@ generation, chromatic chord detection, and figured bass notation.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
-from .chord_logic import ChordMatch
-from .scales import NOTE_TO_PITCH_CLASS
+from .chord_logic import ChordMatch, ChordParser
+from .scales import NOTE_TO_PITCH_CLASS, PITCH_CLASS_NAMES
 from .types import ChordFunction, ChromaticType, ProgressionType
 
 # Enhanced Roman numeral templates with chromatic chord support
@@ -84,6 +85,114 @@ CHORD_FUNCTIONS: Dict[int, Dict[str, ChordFunction]] = {
     },  # vii°/VII
 }
 
+# Scale-degree intervals (semitones above the tonic) for each mode
+DIATONIC_INTERVALS: Dict[str, List[int]] = {
+    "major": [0, 2, 4, 5, 7, 9, 11],
+    "minor": [0, 2, 3, 5, 7, 8, 10],
+}
+
+# Scale degree index (0-6) of each diatonic interval, by mode
+DIATONIC_DEGREE_INDEX: Dict[str, Dict[int, int]] = {
+    mode: {interval: degree for degree, interval in enumerate(intervals)}
+    for mode, intervals in DIATONIC_INTERVALS.items()
+}
+
+# Expected triad qualities for each diatonic scale degree
+DIATONIC_QUALITIES: Dict[str, Dict[int, List[str]]] = {
+    "major": {
+        0: ["major"],  # I
+        2: ["minor"],  # ii
+        4: ["minor"],  # iii
+        5: ["major"],  # IV
+        7: ["major"],  # V
+        9: ["minor"],  # vi
+        11: ["diminished"],  # vii°
+    },
+    # Natural minor chord qualities
+    "minor": {
+        0: ["minor"],  # i
+        2: ["diminished"],  # ii°
+        3: ["major"],  # III
+        5: ["minor"],  # iv
+        7: ["minor"],  # v (or major V)
+        8: ["major"],  # VI
+        10: ["major"],  # VII
+    },
+}
+
+# Secondary dominant notation by interval from the key center
+SECONDARY_DOMINANT_NOTATION: Dict[str, Dict[int, str]] = {
+    "major": {
+        0: "V/IV",  # Root as dominant of IV
+        1: "V/bv",  # C# -> unusual, treat as chromatic mediant
+        2: "V/V",  # D in C major -> tonicizes G (V)
+        3: "V/bVI",  # Eb -> borrowed/chromatic
+        4: "V/vi",  # E in C major -> tonicizes Am (vi)
+        6: "V/bII",  # F# -> Neapolitan area
+        8: "V/bVI",  # Ab -> borrowed chord area
+        9: "V/ii",  # A in C major -> tonicizes Dm (ii)
+        10: "V/bVII",  # Bb -> borrowed from minor
+        11: "V/iii",  # B in C major -> tonicizes Em (iii)
+    },
+    "minor": {
+        0: "V/iv",  # Root chord as dominant of iv
+        1: "V/bV",  # Chromatic
+        2: "V/V",  # D in A minor -> tonicizes Em (v) or E (V)
+        3: "V/VI",  # Eb in A minor -> tonicizes F (VI)
+        4: "V/bVII",  # E -> could tonicize G
+        5: "V/bII",  # F -> Neapolitan
+        7: "V/bIII",  # G -> tonicizes C (III)
+        8: "V/IV",  # Ab -> unusual
+        9: "V/VI",  # A -> tonicizes F (VI)
+        10: "V/bVII",  # Bb -> tonicizes Eb
+        11: "V/VII",  # B -> tonicizes G# (rare in natural minor)
+    },
+}
+
+# Borrowed chord notation for non-dominant chromatic chords
+BORROWED_CHORD_NOTATION: Dict[str, Dict[int, str]] = {
+    # Borrowed from parallel minor in major keys
+    "major": {
+        1: "bii",  # Flat ii
+        3: "bIII",  # Flat III (borrowed)
+        5: "bVII",  # G7 in D major (interval 5) = bVII7
+        6: "bvi",  # Flat vi
+        8: "bVI",  # Flat VI (borrowed)
+        10: "bVII",  # Flat VII (borrowed)
+    },
+    # Borrowed from parallel major in minor keys
+    "minor": {
+        2: "II",  # Major II (borrowed)
+        4: "IV",  # Major IV (borrowed)
+        6: "bVI",  # Flat VI
+        7: "V",  # Major V (borrowed)
+        9: "VI",  # Major VI (borrowed)
+        11: "vii°",  # Diminished vii (borrowed)
+    },
+}
+
+# Last-resort interval-based Roman numerals, indexed by interval from the key
+CHROMATIC_ROMAN_BASE = (
+    "I",
+    "bII",
+    "II",
+    "bIII",
+    "III",
+    "IV",
+    "bV",
+    "V",
+    "bVI",
+    "VI",
+    "bVII",
+    "VII",
+)
+
+# Basic Roman numeral per diatonic scale degree, used by _calculate_roman_numeral
+SCALE_DEGREE_ROMAN_MAP: Dict[str, Dict[int, str]] = {
+    "major": {0: "I", 2: "ii", 4: "iii", 5: "IV", 7: "V", 9: "vi", 11: "vii°"},
+    "minor": {0: "i", 2: "ii°", 3: "III", 5: "iv", 7: "V", 8: "VI", 10: "VII"},
+}
+
 
 @dataclass
 class FunctionalChordAnalysis:
@@ -143,6 +252,7 @@ class FunctionalHarmonyAnalyzer:
 
     def __init__(self):
         self.last_analysis_ambiguity: List[str] = []
+        self.chord_parser = ChordParser()
 
     async def analyze_functionally(
         self, chord_symbols: List[str], parent_key: Optional[str] = None
@@ -232,14 +342,7 @@ class FunctionalHarmonyAnalyzer:
         is_minor = first_chord and (
             "m" in first_chord["chord_name"] and "M" not in first_chord["chord_name"]
         )
-        root_name = next(
-            (
-                name
-                for name, pitch in NOTE_TO_PITCH_CLASS.items()
-                if pitch == suggested_root
-            ),
-            "C",
-        )
+        root_name = PITCH_CLASS_NAMES[suggested_root]
 
         return {
             "key_center": f"{root_name} {'minor' if is_minor else 'major'}",
@@ -269,10 +372,7 @@ class FunctionalHarmonyAnalyzer:
     def _parse_chord_symbol(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Parse chord symbol into components."""
         try:
-            from .chord_logic import ChordParser
-
-            parser = ChordParser()
-            chord_match = parser.parse_chord(symbol)
+            chord_match = self.chord_parser.parse_chord(symbol)
             return {
                 "root": chord_match.root_pitch,
                 "chord_name": symbol,
@@ -296,6 +396,10 @@ class FunctionalHarmonyAnalyzer:
         """
         analyzed_chords = []
 
+        # Key context is constant across the progression; read it once
+        root_pitch = key_analysis["root_pitch"]
+        is_minor = key_analysis["is_minor"]
+
         for symbol in chord_symbols:
             chord_info = self._parse_chord_symbol(symbol)
             if not chord_info:
@@ -303,25 +407,23 @@ class FunctionalHarmonyAnalyzer:
                 continue
 
             # Calculate interval from key center
-            interval_from_key = (
-                chord_info["root"] - key_analysis["root_pitch"] + 12
-            ) % 12
+            interval_from_key = (chord_info["root"] - root_pitch + 12) % 12
 
             # Determine if chord is diatonic or chromatic
             is_diatonic = self._is_chord_diatonic(
-                interval_from_key, key_analysis["is_minor"], chord_info["chord_name"]
+                interval_from_key, is_minor, chord_info["chord_name"]
             )
 
             # Get Roman numeral and function
             roman_numeral = self._get_roman_numeral(
                 interval_from_key,
-                key_analysis["is_minor"],
+                is_minor,
                 chord_info["chord_name"],
                 not is_diatonic,
             )
 
             chord_function = self._get_chord_function(
-                interval_from_key, key_analysis["is_minor"], not is_diatonic
+                interval_from_key, is_minor, not is_diatonic
             )
 
             # Analyze inversion and figured bass
@@ -334,7 +436,7 @@ class FunctionalHarmonyAnalyzer:
             if not is_diatonic:
                 chromatic_type = self._determine_chromatic_type(
                     interval_from_key,
-                    key_analysis["is_minor"],
+                    is_minor,
                     chord_info["chord_name"],
                 )
 
@@ -373,13 +475,9 @@ class FunctionalHarmonyAnalyzer:
         self, interval_from_key: int, is_minor: bool, chord_name: str
     ) -> bool:
         """Check if chord is diatonic to the key."""
-        # Diatonic intervals for each mode
-        diatonic_intervals = (
-            [0, 2, 3, 5, 7, 8, 10] if is_minor else [0, 2, 4, 5, 7, 9, 11]
-        )
-
         # If the interval itself is not diatonic, it's definitely chromatic
-        if interval_from_key not in diatonic_intervals:
+        mode = "minor" if is_minor else "major"
+        if interval_from_key not in DIATONIC_INTERVALS[mode]:
             return False
 
         # Check if chord quality matches expected diatonic chord quality
@@ -398,33 +496,14 @@ class FunctionalHarmonyAnalyzer:
         self, interval_from_key: int, is_minor: bool
     ) -> List[str]:
         """Get expected diatonic chord qualities for a scale degree."""
-        if is_minor:
-            # Natural minor chord qualities
-            minor_qualities = {
-                0: ["minor"],  # i
-                2: ["diminished"],  # ii°
-                3: ["major"],  # III
-                5: ["minor"],  # iv
-                7: ["minor"],  # v (or major V)
-                8: ["major"],  # VI
-                10: ["major"],  # VII
-            }
-            return minor_qualities.get(interval_from_key, [])
-        else:
-            # Major chord qualities
-            major_qualities = {
-                0: ["major"],  # I
-                2: ["minor"],  # ii
-                4: ["minor"],  # iii
-                5: ["major"],  # IV
-                7: ["major"],  # V
-                9: ["minor"],  # vi
-                11: ["diminished"],  # vii°
-            }
-            return major_qualities.get(interval_from_key, [])
-
-    def _parse_chord_quality(self, chord_name: str) -> str:
-        """Parse chord quality from chord name."""
+        qualities = DIATONIC_QUALITIES["minor" if is_minor else "major"]
+        return qualities.get(interval_from_key, [])
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _parse_chord_quality(chord_name: str) -> str:
+        """Parse chord quality from chord name (cached; called several times per
+        chord during analysis)."""
         chord_lower = chord_name.lower()
 
         if "maj7" in chord_lower or "M7" in chord_lower:
@@ -485,11 +564,9 @@ class FunctionalHarmonyAnalyzer:
 
         if not is_chromatic:
             # Use diatonic Roman numerals
-            diatonic_intervals = (
-                [0, 2, 3, 5, 7, 8, 10] if is_minor else [0, 2, 4, 5, 7, 9, 11]
-            )
-            try:
-                scale_index = diatonic_intervals.index(interval_from_key)
+            degree_index = DIATONIC_DEGREE_INDEX["minor" if is_minor else "major"]
+            scale_index = degree_index.get(interval_from_key)
+            if scale_index is not None:
                 numeral = templates["diatonic"][scale_index]
 
                 # Add chord extensions and modifications
@@ -505,8 +582,7 @@ class FunctionalHarmonyAnalyzer:
                     numeral += "sus2"
 
                 return numeral
-            except ValueError:
-                pass  # Fall through to chromatic analysis
+            # Otherwise fall through to chromatic analysis
 
         # Handle chromatic chords with comprehensive analysis
         if is_chromatic:
@@ -525,18 +601,7 @@ class FunctionalHarmonyAnalyzer:
                 if self._is_likely_secondary_dominant(
                     interval_from_key, actual_quality
                 ):
-                    major_secondary_notation = {
-                        0: "V/IV",  # Root as dominant of IV
-                        1: "V/bv",  # C# -> unusual, treat as chromatic mediant
-                        2: "V/V",  # D in C major -> tonicizes G (V)
-                        3: "V/bVI",  # Eb -> borrowed/chromatic
-                        4: "V/vi",  # E in C major -> tonicizes Am (vi)
-                        6: "V/bII",  # F# -> Neapolitan area
-                        8: "V/bVI",  # Ab -> borrowed chord area
-                        9: "V/ii",  # A in C major -> tonicizes Dm (ii)
-                        10: "V/bVII",  # Bb -> borrowed from minor
-                        11: "V/iii",  # B in C major -> tonicizes Em (iii)
-                    }
+                    major_secondary_notation = SECONDARY_DOMINANT_NOTATION["major"]
 
                     # Specific fixes for common intervals
                     if interval_from_key in [7, 9]:
@@ -553,19 +618,7 @@ class FunctionalHarmonyAnalyzer:
 
             # Secondary dominant detection for minor keys
             if is_minor and is_dominant_quality:
-                minor_secondary_notation = {
-                    0: "V/iv",  # Root chord as dominant of iv
-                    1: "V/bV",  # Chromatic
-                    2: "V/V",  # D in A minor -> tonicizes Em (v) or E (V)
-                    3: "V/VI",  # Eb in A minor -> tonicizes F (VI)
-                    4: "V/bVII",  # E -> could tonicize G
-                    5: "V/bII",  # F -> Neapolitan
-                    7: "V/bIII",  # G -> tonicizes C (III)
-                    8: "V/IV",  # Ab -> unusual
-                    9: "V/VI",  # A -> tonicizes F (VI)
-                    10: "V/bVII",  # Bb -> tonicizes Eb
-                    11: "V/VII",  # B -> tonicizes G# (rare in natural minor)
-                }
+                minor_secondary_notation = SECONDARY_DOMINANT_NOTATION["minor"]
 
                 if interval_from_key in minor_secondary_notation:
                     notation = minor_secondary_notation[interval_from_key]
@@ -576,27 +629,9 @@ class FunctionalHarmonyAnalyzer:
                     return notation
 
             # For non-dominant chromatic chords, use borrowed chord notation
-            chromatic_notation = (
-                {
-                    # Borrowed from parallel major in minor keys
-                    2: "II",  # Major II (borrowed)
-                    4: "IV",  # Major IV (borrowed)
-                    6: "bVI",  # Flat VI
-                    7: "V",  # Major V (borrowed)
-                    9: "VI",  # Major VI (borrowed)
-                    11: "vii°",  # Diminished vii (borrowed)
-                }
-                if is_minor
-                else {
-                    # Borrowed from parallel minor in major keys
-                    1: "bii",  # Flat ii
-                    3: "bIII",  # Flat III (borrowed)
-                    5: "bVII",  # G7 in D major (interval 5) = bVII7
-                    6: "bvi",  # Flat vi
-                    8: "bVI",  # Flat VI (borrowed)
-                    10: "bVII",  # Flat VII (borrowed)
-                }
-            )
+            chromatic_notation = BORROWED_CHORD_NOTATION[
+                "minor" if is_minor else "major"
+            ]
 
             if interval_from_key in chromatic_notation:
                 result = chromatic_notation[interval_from_key]
@@ -610,22 +645,7 @@ class FunctionalHarmonyAnalyzer:
                 return result
 
             # Last resort - use interval-based Roman numeral
-            interval_to_roman_base = {
-                0: "I",
-                1: "bII",
-                2: "II",
-                3: "bIII",
-                4: "III",
-                5: "IV",
-                6: "bV",
-                7: "V",
-                8: "bVI",
-                9: "VI",
-                10: "bVII",
-                11: "VII",
-            }
-
-            result = interval_to_roman_base.get(interval_from_key, "I")
+            result = CHROMATIC_ROMAN_BASE[interval_from_key]
 
             # Apply chord quality
             if actual_quality == "minor":
@@ -925,26 +945,7 @@ class FunctionalHarmonyAnalyzer:
         scale_degree = (chord_pitch - key_pitch) % 12
 
         # Get basic Roman numeral
-        if mode == "major":
-            roman_map = {
-                0: "I",
-                2: "ii",
-                4: "iii",
-                5: "IV",
-                7: "V",
-                9: "vi",
-                11: "vii°",
-            }
-        else:
-            roman_map = {
-                0: "i",
-                2: "ii°",
-                3: "III",
-                5: "iv",
-                7: "V",
-                8: "VI",
-                10: "VII",
-            }
+        roman_map = SCALE_DEGREE_ROMAN_MAP["major" if mode == "major" else "minor"]
 
         roman = roman_map.get(scale_degree, "X")  # X for unknown/chromatic
 
@@ -2,12 +2,29 @@
 Enhanced modal analysis engine with evidence-based confidence scoring.
 """
 
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
 from .chord_logic import ChordMatch, find_chord_matches
 from .scales import NOTE_TO_PITCH_CLASS, get_parent_key
 
+# Basic interval to Roman numeral mapping, indexed by semitones above the tonic
+INTERVAL_ROMAN_NUMERALS = (
+    "I",  # Unison
+    "bII",  # Minor second
+    "II",  # Major second
+    "bIII",  # Minor third
+    "III",  # Major third
+    "IV",  # Perfect fourth
+    "bV",  # Tritone
+    "V",  # Perfect fifth
+    "bVI",  # Minor sixth
+    "VI",  # Major sixth
+    "bVII",  # Minor seventh
+    "VII",  # Major seventh
+)
+
 
 @dataclass
 class ModalEvidence:
@@ -140,9 +157,7 @@ class EnhancedModalAnalyzer:
                 candidates.append(last_root)
 
         # Most frequent chord root
-        root_counts = {}
-        for chord in chord_matches:
-            root_counts[chord.root] = root_counts.get(chord.root, 0) + 1
+        root_counts = Counter(chord.root for chord in chord_matches)
 
         most_frequent = max(root_counts.items(), key=lambda x: x[1])[0]
         if most_frequent not in candidates:
@@ -168,14 +183,12 @@ class EnhancedModalAnalyzer:
             return None
 
         # Determine most likely mode
-        mode_scores = {}
+        mode_scores: Dict[str, float] = defaultdict(float)
         evidence = []
 
         for pattern_match in pattern_matches:
             for mode in pattern_match["pattern"].modes:
-                mode_scores[mode] = (
-                    mode_scores.get(mode, 0) + pattern_match["pattern"].strength
-                )
+                mode_scores[mode] += pattern_match["pattern"].strength
 
                 evidence.append(
                     ModalEvidence(
@@ -230,24 +243,7 @@ class EnhancedModalAnalyzer:
 
         for chord in chord_matches:
             interval = (chord.root_pitch - tonic_pitch) % 12
-
-            # Basic interval to Roman numeral mapping
-            interval_to_roman = {
-                0: "I",  # Unison
-                1: "bII",  # Minor second
-                2: "II",  # Major second
-                3: "bIII",  # Minor third
-                4: "III",  # Major third
-                5: "IV",  # Perfect fourth
-                6: "bV",  # Tritone
-                7: "V",  # Perfect fifth
-                8: "bVI",  # Minor sixth
-                9: "VI",  # Major sixth
-                10: "bVII",  # Minor seventh
-                11: "VII",  # Major seventh
-            }
-
-            base_roman = interval_to_roman.get(interval, "X")
+            base_roman = INTERVAL_ROMAN_NUMERALS[interval]
 
             # Adjust case based on chord quality
             if chord.quality == "minor":
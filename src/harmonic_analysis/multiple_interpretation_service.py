@@ -14,18 +14,21 @@ Architecture:
 """
 
 import asyncio
-import json
+import logging
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Optional
+from itertools import takewhile
+from typing import Any, Dict, Final, List, Optional, Tuple, Union
 
 from .enhanced_modal_analyzer import EnhancedModalAnalyzer, ModalAnalysisResult
 from .functional_harmony import (FunctionalAnalysisResult,
                                  FunctionalHarmonyAnalyzer)
 from .types import AnalysisOptions
 
+logger = logging.getLogger(__name__)
+
 
 class EvidenceType(Enum):
     """Types of analytical evidence"""
@@ -146,46 +149,123 @@ EVIDENCE_WEIGHTS = {
     EvidenceType.CONTEXTUAL: 0.15,  # Overall context
 }
 
+# Cadence-specific strength values based on music theory analysis
+CADENCE_STRENGTHS = {
+    "authentic": 0.90,  # V-I - strongest resolution
+    "plagal": 0.65,  # IV-I - gentle, conclusive but weak
+    "deceptive": 0.70,  # V-vi - surprising but clear
+    "half": 0.50,  # ends on V - inconclusive
+    "phrygian": 0.80,  # bII-I - strong modal cadence
+    "modal": 0.75,  # bVII-I and other modal cadences
+}
+
+# Descriptive resolution quality for each cadence type
+CADENCE_QUALITIES = {
+    "authentic": "strong",
+    "plagal": "gentle",
+    "deceptive": "surprising",
+    "half": "inconclusive",
+    "phrygian": "modal",
+    "modal": "characteristic",
+}
+
+# Classic strong progressions (high theoretical strength) and their variations
+STRONG_FUNCTIONAL_PATTERNS = {
+    # Circle of fifths progressions
+    "I-vi-IV-V": ("I-vi-IV-V", "i-VI-iv-V"),
+    "vi-IV-I-V": ("vi-IV-I-V", "VI-iv-i-v"),
+    "IV-I-V-vi": ("IV-I-V-vi", "iv-i-v-VI"),
+    # Jazz standards
+    "ii-V-I": ("ii-V-I", "IIo-V-I", "ii7-V7-I"),
+    "I-vi-ii-V": ("I-vi-ii-V", "i-VI-iio-V"),
+    # Common pop/rock patterns
+    "I-V-vi-IV": ("I-V-vi-IV", "I-V-VI-IV"),
+    "vi-IV-I-V-pop": ("vi-IV-I-V", "VI-IV-I-V"),
+    # Authentic cadences
+    "V-I": ("V-I", "V7-I", "v-i"),
+    "ii-V-I-cadence": ("ii-V-I", "iio-V-I"),
+    # Plagal variants (still functional but weaker - handled elsewhere)
+}
+
+# Scale degree of each Roman numeral, for sequence detection
+ROMAN_NUMERAL_DEGREES = {
+    "I": 1,
+    "ii": 2,
+    "iii": 3,
+    "IV": 4,
+    "V": 5,
+    "vi": 6,
+    "vii": 7,
+    "i": 1,
+    "II": 2,
+    "III": 3,
+    "iv": 4,
+    "v": 5,
+    "VI": 6,
+    "VII": 7,
+}
+
+# Upper bound on progressions accepted by a single batch call
+MAX_BATCH_SIZE = 100
+
+
+class _Missing(Enum):
+    """Sentinel for attribute lookups where None is a legitimate value"""
+
+    MISSING = "missing"
+
+
+_MISSING: Final = _Missing.MISSING
+
+# Analysis cache key: the chord sequence plus the analysis option values
+CacheKey = Tuple[Tuple[str, ...], Tuple[Any, ...]]
+
 
 class AnalysisCache:
-    """Simple cache for performance optimization"""
+    """Simple LRU cache for performance optimization"""
 
     def __init__(self, max_size: int = 100, ttl_minutes: int = 5):
-        self.cache: Dict[str, MultipleInterpretationResult] = {}
-        self.timestamps: Dict[str, datetime] = {}
+        # Ordered from least to most recently used
+        self.cache: OrderedDict[CacheKey, MultipleInterpretationResult] = OrderedDict()
+        # Monotonic insertion times, immune to wall-clock adjustments
+        self.timestamps: Dict[CacheKey, float] = {}
         self.max_size = max_size
-        self.ttl = timedelta(minutes=ttl_minutes)
+        self.ttl = ttl_minutes * 60.0  # seconds
 
-    def get(self, key: str) -> Optional[MultipleInterpretationResult]:
+    def get(self, key: CacheKey) -> Optional[MultipleInterpretationResult]:
         """Get cached result if still valid"""
         if key not in self.cache:
             return None
 
         # Check TTL
-        if datetime.now() - self.timestamps[key] > self.ttl:
+        if time.monotonic() - self.timestamps[key] > self.ttl:
             del self.cache[key]
             del self.timestamps[key]
             return None
 
+        self.cache.move_to_end(key)
         return self.cache[key]
 
-    def set(self, key: str, result: MultipleInterpretationResult) -> None:
+    def set(self, key: CacheKey, result: MultipleInterpretationResult) -> None:
         """Cache result with LRU eviction"""
-        # Implement LRU by clearing oldest entries
-        if len(self.cache) >= self.max_size:
-            oldest_key = min(self.timestamps.keys(), key=lambda k: self.timestamps[k])
-            del self.cache[oldest_key]
+        if key in self.cache:
+            self.cache.move_to_end(key)
+        elif len(self.cache) >= self.max_size:
+            # Evict the least recently used entry
+            oldest_key, _ = self.cache.popitem(last=False)
             del self.timestamps[oldest_key]
 
         self.cache[key] = result
-        self.timestamps[key] = datetime.now()
+        self.timestamps[key] = time.monotonic()
 
     def get_cache_key(
         self, chords: List[str], options: Optional[AnalysisOptions] = None
-    ) -> str:
+    ) -> CacheKey:
         """Generate cache key from input"""
-        options_str = json.dumps(options.__dict__ if options else {}, sort_keys=True)
-        return f"{'_'.join(chords)}_{hash(options_str)}"
+        # Option fields are all hashable scalars, so their values (in field
+        # order) form the key directly without serializing to JSON
+        options_key = tuple(vars(options).values()) if options else ()
+        return tuple(chords), options_key
 
 
 class MultipleInterpretationService:
@@ -212,7 +292,7 @@ class MultipleInterpretationService:
         if not chords:
             raise ValueError("Empty chord progression provided")
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         if options is None:
             options = AnalysisOptions()
@@ -265,7 +345,7 @@ class MultipleInterpretationService:
             )
 
             # Create result
-            analysis_time_ms = (time.time() - start_time) * 1000
+            analysis_time_ms = (time.perf_counter() - start_time) * 1000
 
             result = MultipleInterpretationResult(
                 primary_analysis=(
@@ -297,6 +377,41 @@ class MultipleInterpretationService:
         except Exception as error:
             raise Exception(f"Multiple interpretation analysis failed: {str(error)}")
 
+    async def analyze_progressions(
+        self,
+        progressions: List[List[str]],
+        options: Optional[AnalysisOptions] = None,
+    ) -> List[Union[MultipleInterpretationResult, BaseException]]:
+        """
+        Analyze a batch of progressions in a single call
+
+        Args:
+            progressions: List of chord symbol lists
+            options: Analysis options applied to every progression
+
+        Returns:
+            One entry per progression in input order. A progression that fails
+            yields its exception instead of a result, so one bad item does not
+            abort the rest of the batch.
+        """
+        if len(progressions) > MAX_BATCH_SIZE:
+            raise ValueError(
+                f"Batch of {len(progressions)} progressions exceeds the maximum "
+                f"of {MAX_BATCH_SIZE}"
+            )
+
+        # Dispatch shortest progressions first so a few long ones don't hold up
+        # the rest of the batch, then restore input order
+        order = sorted(range(len(progressions)), key=lambda i: len(progressions[i]))
+        outcomes = await asyncio.gather(
+            *(self.analyze_progression(progressions[i], options) for i in order),
+            return_exceptions=True,
+        )
+        return [
+            outcome
+            for _, outcome in sorted(zip(order, outcomes), key=lambda pair: pair[0])
+        ]
+
     async def _run_functional_analysis(
         self, chords: List[str], options: AnalysisOptions
     ) -> Optional[FunctionalAnalysisResult]:
@@ -306,7 +421,7 @@ class MultipleInterpretationService:
                 chords, options.parent_key
             )
         except Exception as e:
-            print(f"Warning: Functional analysis failed: {e}")
+            logger.warning("Functional analysis failed: %s", e)
             return None
 
     async def _run_modal_analysis(
@@ -314,11 +429,16 @@ class MultipleInterpretationService:
     ) -> Optional[ModalAnalysisResult]:
         """Run modal analysis"""
         try:
-            return self.modal_analyzer.analyze_modal_characteristics(
-                chords, options.parent_key
+            # The modal analyzer is synchronous; run it in a worker thread so it
+            # doesn't block the event loop. Functional analysis stays on the loop
+            # because it records last_analysis_ambiguity on the shared analyzer
+            return await asyncio.to_thread(
+                self.modal_analyzer.analyze_modal_characteristics,
+                chords,
+                options.parent_key,
             )
         except Exception as e:
-            print(f"Warning: Modal analysis failed: {e}")
+            logger.warning("Modal analysis failed: %s", e)
             return None
 
     async def _calculate_interpretations(
@@ -378,7 +498,7 @@ class MultipleInterpretationService:
                 ),
             )
         except Exception as e:
-            print(f"Warning: Failed to create functional interpretation: {e}")
+            logger.warning("Failed to create functional interpretation: %s", e)
             return None
 
     def _create_modal_interpretation(
@@ -406,7 +526,7 @@ class MultipleInterpretationService:
                 ),
             )
         except Exception as e:
-            print(f"Warning: Failed to create modal interpretation: {e}")
+            logger.warning("Failed to create modal interpretation: %s", e)
             return None
 
     def _collect_functional_evidence(
@@ -418,23 +538,11 @@ class MultipleInterpretationService:
         # Cadential evidence with cadence-specific strength calibration
         if functional_result.cadences:
             cadence = functional_result.cadences[0]
-            cadence_name = getattr(
-                cadence, "name", getattr(cadence, "type", "authentic")
-            )
-
-            # Cadence-specific strength values based on music theory analysis
-            cadence_strengths = {
-                "authentic": 0.90,  # V-I - strongest resolution
-                "plagal": 0.65,  # IV-I - gentle, conclusive but weak
-                "deceptive": 0.70,  # V-vi - surprising but clear
-                "half": 0.50,  # ends on V - inconclusive
-                "phrygian": 0.80,  # bII-I - strong modal cadence
-                "modal": 0.75,  # bVII-I and other modal cadences
-            }
+            cadence_name = self._get_cadence_name(cadence)
 
             # Normalize cadence name and get appropriate strength
             cadence_key = cadence_name.lower().replace("_", "")
-            cadence_strength = cadence_strengths.get(
+            cadence_strength = CADENCE_STRENGTHS.get(
                 cadence_key, 0.60
             )  # default for unknown
 
@@ -533,11 +641,7 @@ class MultipleInterpretationService:
 
         # Modal characteristics
         for modal_evidence in modal_result.evidence:
-            chord_info = getattr(
-                modal_evidence,
-                "chord",
-                getattr(modal_evidence, "pattern", str(modal_evidence)),
-            )
+            chord_info = self._get_evidence_label(modal_evidence)
             evidence.append(
                 AnalysisEvidence(
                     type=EvidenceType.INTERVALLIC,
@@ -572,19 +676,21 @@ class MultipleInterpretationService:
         if not evidence:
             return 0.2
 
-        # Weighted average based on evidence types
+        # Weighted average based on evidence types, collecting the distinct
+        # types in the same pass
         total_weight = 0.0
         weighted_sum = 0.0
+        evidence_types = set()
 
         for ev in evidence:
             weight = EVIDENCE_WEIGHTS.get(ev.type, 0.1)
             total_weight += weight
             weighted_sum += ev.strength * weight
+            evidence_types.add(ev.type)
 
         base_confidence = weighted_sum / total_weight if total_weight > 0 else 0.2
 
         # Bonus for multiple evidence types
-        evidence_types = {ev.type for ev in evidence}
         diversity_bonus = 0.1 if len(evidence_types) > 1 else 0
 
         return min(1.0, base_confidence + diversity_bonus)
@@ -599,9 +705,7 @@ class MultipleInterpretationService:
 
         if functional_result.cadences:
             cadence = functional_result.cadences[0]
-            cadence_name = getattr(
-                cadence, "name", getattr(cadence, "type", "authentic")
-            )
+            cadence_name = self._get_cadence_name(cadence)
             reasons.append(
                 f"Strong {cadence_name} cadence establishes functional tonality"
             )
@@ -630,11 +734,7 @@ class MultipleInterpretationService:
 
         if modal_result.evidence:
             first_evidence = modal_result.evidence[0]
-            chord_info = getattr(
-                first_evidence,
-                "chord",
-                getattr(first_evidence, "pattern", str(first_evidence)),
-            )
+            chord_info = self._get_evidence_label(first_evidence)
             reasons.append(
                 f"{chord_info} is characteristic of {modal_result.mode_name} mode"
             )
@@ -668,32 +768,35 @@ class MultipleInterpretationService:
         max_alternatives: int,
     ) -> List[AlternativeAnalysis]:
         """Filter alternatives based on confidence and limits"""
-        if len(ranked_interpretations) <= 1:
+        if len(ranked_interpretations) <= 1 or max_alternatives <= 0:
             return []
 
         primary = ranked_interpretations[0]
-        alternatives = ranked_interpretations[1 : max_alternatives + 1]
-
-        filtered_alternatives = []
-        for alt in alternatives:
-            if alt.confidence >= confidence_threshold:
-                alt_analysis = AlternativeAnalysis(
-                    type=alt.type,
-                    confidence=alt.confidence,
-                    analysis=alt.analysis,
-                    roman_numerals=alt.roman_numerals,
-                    key_signature=alt.key_signature,
-                    mode=alt.mode,
-                    evidence=alt.evidence,
-                    reasoning=alt.reasoning,
-                    theoretical_basis=alt.theoretical_basis,
-                    relationship_to_primary=self._generate_relationship_description(
-                        primary, alt
-                    ),
-                )
-                filtered_alternatives.append(alt_analysis)
 
-        return filtered_alternatives
+        # Interpretations are ranked by confidence, so nothing after the first
+        # one below the threshold can qualify
+        qualifying = takewhile(
+            lambda alt: alt.confidence >= confidence_threshold,
+            ranked_interpretations[1 : max_alternatives + 1],
+        )
+
+        return [
+            AlternativeAnalysis(
+                type=alt.type,
+                confidence=alt.confidence,
+                analysis=alt.analysis,
+                roman_numerals=alt.roman_numerals,
+                key_signature=alt.key_signature,
+                mode=alt.mode,
+                evidence=alt.evidence,
+                reasoning=alt.reasoning,
+                theoretical_basis=alt.theoretical_basis,
+                relationship_to_primary=self._generate_relationship_description(
+                    primary, alt
+                ),
+            )
+            for alt in qualifying
+        ]
 
     def _generate_relationship_description(
         self, primary: InterpretationAnalysis, alternative: InterpretationAnalysis
@@ -759,17 +862,25 @@ class MultipleInterpretationService:
             theoretical_basis="Basic chord progression analysis",
         )
 
+    def _get_cadence_name(self, cadence: Any) -> str:
+        """Get cadence name, falling back to its type"""
+        # Resolve fallbacks lazily instead of evaluating nested getattr defaults
+        name = getattr(cadence, "name", _MISSING)
+        if name is not _MISSING:
+            return name
+        return getattr(cadence, "type", "authentic")
+
+    def _get_evidence_label(self, modal_evidence: Any) -> str:
+        """Get the chord or pattern a piece of modal evidence refers to"""
+        for attr in ("chord", "pattern"):
+            label = getattr(modal_evidence, attr, _MISSING)
+            if label is not _MISSING:
+                return label
+        return str(modal_evidence)
+
     def _get_cadence_quality(self, cadence_key: str) -> str:
         """Get descriptive quality for different cadence types"""
-        cadence_qualities = {
-            "authentic": "strong",
-            "plagal": "gentle",
-            "deceptive": "surprising",
-            "half": "inconclusive",
-            "phrygian": "modal",
-            "modal": "characteristic",
-        }
-        return cadence_qualities.get(cadence_key, "moderate")
+        return CADENCE_QUALITIES.get(cadence_key, "moderate")
 
     def _detect_strong_functional_patterns(
         self, roman_numerals: List[str]
@@ -778,26 +889,8 @@ class MultipleInterpretationService:
         patterns = []
         rn_str = "-".join(roman_numerals)
 
-        # Classic strong progressions (high theoretical strength)
-        strong_patterns = {
-            # Circle of fifths progressions
-            "I-vi-IV-V": ["I-vi-IV-V", "i-VI-iv-V"],
-            "vi-IV-I-V": ["vi-IV-I-V", "VI-iv-i-v"],
-            "IV-I-V-vi": ["IV-I-V-vi", "iv-i-v-VI"],
-            # Jazz standards
-            "ii-V-I": ["ii-V-I", "IIo-V-I", "ii7-V7-I"],
-            "I-vi-ii-V": ["I-vi-ii-V", "i-VI-iio-V"],
-            # Common pop/rock patterns
-            "I-V-vi-IV": ["I-V-vi-IV", "I-V-VI-IV"],
-            "vi-IV-I-V-pop": ["vi-IV-I-V", "VI-IV-I-V"],
-            # Authentic cadences
-            "V-I": ["V-I", "V7-I", "v-i"],
-            "ii-V-I-cadence": ["ii-V-I", "iio-V-I"],
-            # Plagal variants (still functional but weaker - handled elsewhere)
-        }
-
         # Check for exact matches and partial matches
-        for pattern_name, variations in strong_patterns.items():
+        for pattern_name, variations in STRONG_FUNCTIONAL_PATTERNS.items():
             for variation in variations:
                 if rn_str == variation or rn_str.endswith(variation):
                     patterns.append(pattern_name)
@@ -816,25 +909,10 @@ class MultipleInterpretationService:
             return False
 
         # Convert roman numerals to scale degrees for sequence detection
-        degree_map = {
-            "I": 1,
-            "ii": 2,
-            "iii": 3,
-            "IV": 4,
-            "V": 5,
-            "vi": 6,
-            "vii": 7,
-            "i": 1,
-            "II": 2,
-            "III": 3,
-            "iv": 4,
-            "v": 5,
-            "VI": 6,
-            "VII": 7,
-        }
-
         try:
-            degrees = [degree_map.get(rn.rstrip("7o"), 0) for rn in roman_numerals]
+            degrees = [
+                ROMAN_NUMERAL_DEGREES.get(rn.rstrip("7o"), 0) for rn in roman_numerals
+            ]
 
             # Check for ascending or descending sequences
             if all(
@@ -872,3 +950,21 @@ async def analyze_progression_multiple(
         Complete multiple interpretation result
     """
     return await multiple_interpretation_service.analyze_progression(chords, options)
+
+
+async def analyze_progressions_multiple(
+    progressions: List[List[str]], options: Optional[AnalysisOptions] = None
+) -> List[Union[MultipleInterpretationResult, BaseException]]:
+    """
+    Convenience function for batch multiple interpretation analysis
+
+    Args:
+        progressions: List of chord symbol lists
+        options: Analysis options applied to every progression
+
+    Returns:
+        Results (or per-item exceptions) in input order
+    """
+    return await multiple_interpretation_service.analyze_progressions(
+        progressions, options
+    )
@@ -151,9 +151,4 @@ def generate_scale_notes(tonic: str, intervals: List[int]) -> List[str]:
     if tonic_pitch is None:
         raise ValueError(f"Invalid tonic: {tonic}")
 
-    scale_notes = []
-    for interval in intervals:
-        pitch_class = (tonic_pitch + interval) % 12
-        scale_notes.append(PITCH_CLASS_NAMES[pitch_class])
-
-    return scale_notes
+    return [PITCH_CLASS_NAMES[(tonic_pitch + interval) % 12] for interval in intervals]
@@ -53,6 +53,19 @@ class TestChordParser:
         assert result["root"] == "C"
         assert result["bass_note"] == "E"
 
+    def test_parse_unicode_accidentals(self):
+        """Test that unicode sharps and flats normalize to ASCII spelling"""
+        result = self.parser.parse_chord_symbol("F♯m7/C♯")
+        assert result is not None
+        assert result["root"] == "F#"
+        assert result["pitch_class"] == 6
+        assert result["bass_note"] == "C#"
+
+        result = self.parser.parse_chord_symbol("B♭maj7")
+        assert result is not None
+        assert result["root"] == "Bb"
+        assert result["quality"] == "major7"
+
     def test_parse_suspended_chords(self):
         """Test parsing suspended chords"""
         test_cases = [
@@ -14,7 +14,9 @@ import pytest
 from harmonic_analysis import (AnalysisOptions, EvidenceType,
                                InterpretationType,
                                MultipleInterpretationService, PedagogicalLevel,
-                               analyze_progression_multiple)
+                               analyze_progression_multiple,
+                               analyze_progressions_multiple)
+from harmonic_analysis.multiple_interpretation_service import AnalysisCache
 
 
 class TestMultipleInterpretationService:
@@ -254,6 +256,24 @@ class TestMultipleInterpretationService:
                 assert alt.confidence <= result.primary_analysis.confidence
 
 
+class TestAnalysisCache:
+    """Test the analysis result cache"""
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first"""
+        cache = AnalysisCache(max_size=2)
+        cache.set("a", "result_a")
+        cache.set("b", "result_b")
+
+        # Touch "a" so "b" becomes the least recently used entry
+        assert cache.get("a") == "result_a"
+        cache.set("c", "result_c")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "result_a"
+        assert cache.get("c") == "result_c"
+
+
 class TestConvenienceFunctions:
     """Test convenience functions"""
 
@@ -280,6 +300,24 @@ class TestConvenienceFunctions:
         assert result.metadata.pedagogical_level == PedagogicalLevel.ADVANCED
         assert result.metadata.confidence_threshold == 0.4
 
+    @pytest.mark.asyncio
+    async def test_analyze_progressions_multiple(self):
+        """Test batch convenience function preserves order and isolates failures"""
+        progressions = [["C", "Am", "F", "G"], [], ["Dm", "G", "C"], ["F", "C"]]
+        results = await analyze_progressions_multiple(progressions)
+
+        assert len(results) == 4
+        assert results[0].input_chords == ["C", "Am", "F", "G"]
+        assert isinstance(results[1], Exception)
+        assert results[2].input_chords == ["Dm", "G", "C"]
+        assert results[3].input_chords == ["F", "C"]
+
+    @pytest.mark.asyncio
+    async def test_analyze_progressions_multiple_batch_limit(self):
+        """Test that oversized batches are rejected"""
+        with pytest.raises(ValueError):
+            await analyze_progressions_multiple([["C", "G"]] * 101)
+
 
 class TestPerformance:
     """Test performance characteristics"""